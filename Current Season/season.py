@@ -7,80 +7,241 @@
 # https://statsapi.mlb.com/api/v1/schedule?sportId=1&teamId=141&startDate=2025-03-18&endDate=2025-09-28&gameType=R
 
 import pandas as pd
-import requests
+import argparse
+import json
 import os
+import sys
+import requests
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlbapi import cache, client, gamelog, schemas, storage, store, stream, teams
 os.system('cls' if os.name == 'nt' else 'clear')
 
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULT_COLUMNS = ["Date", "Win", "Team Score", "Opponent Score"]
+TRACKER_DIR = os.path.join(cache.CACHE_DIR, "season_tracker")
+
+# Games in these states will never become final on their original date
+NEVER_FINAL_STATES = ("postponed", "cancelled")
+
 def get_season_dates(season):
-    url = f"https://statsapi.mlb.com/api/v1/seasons?sportId=1&season={season}"
-    response = requests.get(url)
+    response = client.get("seasons", params={"sportId": 1, "season": season})
     if response.status_code != 200:
         print("Failed to fetch season data")
         return None, None
-    data = response.json()
-    regularSeasonStartDate = data['seasons'][0]['regularSeasonStartDate']
-    regularSeasonEndDate = data['seasons'][0]['regularSeasonEndDate']
-    return regularSeasonStartDate, regularSeasonEndDate
+    season_info = schemas.decode(response.content, schemas.Seasons).seasons[0]
+    return season_info.regularSeasonStartDate, season_info.regularSeasonEndDate
 
 def get_team_id(team_name):
-    url = "https://statsapi.mlb.com/api/v1/teams"
-    response = requests.get(url)
-    data = response.json()
-    teams = data.get("teams", [])
-    
-    for team in teams:
-        if team["name"].lower() == team_name.lower():
-            return team["id"]
-    return None
+    # Resolved from the local team index instead of downloading /teams every time
+    return teams.get_team_id(team_name)
 
-def get_team_wins_losses(team_id, startDate, today):
-    url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&teamId={team_id}&startDate={startDate}&endDate={today}&gameType=R"
-    response = requests.get(url)
-    # retrieve when and if the team won or lost in a list of tuples
-    if response.status_code != 200:
-        print("Failed to fetch team data")
-        return None
-    data = response.json()
-    games = data.get("dates", [])
+def get_schedule_dates(startDate, endDate, team_id=None, window_days=None):
+    """
+    Download the regular-season schedule between two dates and return its dates as
+    schemas.ScheduleDate records.
+    Without team_id every game in the league is returned. With window_days the range is
+    fetched as several smaller requests in parallel and stitched back together in order.
+    """
+    params = {"sportId": 1, "gameType": "R"}
+    if team_id:
+        params["teamId"] = team_id
+    windows = client.date_windows(startDate, endDate, window_days) if window_days else [(startDate, endDate)]
+    params_list = [dict(params, startDate=start, endDate=end) for start, end in windows]
+
+    dates = []
+    for response in client.get_many("schedule", params_list):
+        if response is None or response.status_code != 200:
+            print("Failed to fetch schedule data")
+            return None
+        dates.extend(schemas.decode(response.content, schemas.Schedule).dates)
+
+    conn = store.connect()
+    store.insert_games(conn, dates)
+    conn.close()
+    return dates
+
+def team_result(matchup, team_side, date=""):
+    # (date, won, runs scored, runs allowed) for one side of a completed game
+    opponent_side = "away" if team_side == "home" else "home"
+    team_info = getattr(matchup.teams, team_side)
+    opponent_info = getattr(matchup.teams, opponent_side)
+    return (
+        matchup.officialDate or date,
+        bool(team_info.isWinner),
+        team_info.score,
+        opponent_info.score
+    )
+
+def is_final(matchup):
+    return matchup.status.detailedState.lower() == "final"
+
+def collect_team_games(games, team_id):
+    # Completed results for one team, plus the dates of its games that are not final yet
     results = []
+    pending_dates = []
     for game in games:
-        for matchup in game.get("games", []):
+        for matchup in game.games:
             # Determine if the team is home or away in this matchup
-            away = matchup["teams"]["away"]["team"]["id"]
-            home = matchup["teams"]["home"]["team"]["id"]
-            if team_id == home or team_id == away:
-                team_side = "home" if team_id == home else "away"
-                team_info = matchup["teams"][team_side]
-                opponent_side = "away" if team_side == "home" else "home"
-                opponent_info = matchup["teams"][opponent_side]
+            team_side = matchup.side(team_id)
+            if team_side:
                 # Only consider completed games
-                if matchup["status"]["detailedState"].lower() == "final":
-                    is_win = team_info.get("isWinner", False)
-                    results.append((
-                        matchup.get("officialDate", matchup.get("gameDate", game.get("date"))),
-                        is_win,
-                        team_info["score"],
-                        opponent_info["score"]
-                    ))
+                if is_final(matchup):
+                    results.append(team_result(matchup, team_side, game.date))
+                elif matchup.status.detailedState.lower() not in NEVER_FINAL_STATES:
+                    pending_dates.append(matchup.officialDate or game.date)
+    return results, pending_dates
+
+def get_team_wins_losses(team_id, startDate, today):
+    # retrieve when and if the team won or lost in a list of tuples
+    games = get_schedule_dates(startDate, today, team_id=team_id)
+    if games is None:
+        print("Failed to fetch team data")
+        return None
+    results, _ = collect_team_games(games, team_id)
     return results
 
-today = pd.Timestamp.now().date()
-season = today.year
-startDate, endDate = get_season_dates(season)
-if startDate and endDate:
-    print(f"Season {season} starts on {startDate} and ends on {endDate}. Today's date is {today}.")
-
-team = "Toronto Blue Jays" 
-team_id = get_team_id(team)
-print(f"Team ID for {team}: {team_id}")
-
-if team_id:
-    results = get_team_wins_losses(team_id, startDate, today)
-    if results:
-        df = pd.DataFrame(results, columns=["Date", "Win", "Team Score", "Opponent Score"])
-        df["Win"] = df["Win"].apply(lambda x: "W" if x else "L")
-        # print(df)
-        df.to_csv(f"./Current Season/{team.replace(' ', '_')}_season_results.csv", index=False)
-        print(f"Season results for {team} saved to {team.replace(' ', '_')}_season_results.csv")
+def stream_league_games(startDate, endDate, window_days=None):
+    # Games are parsed and stored one batch at a time, so the full schedule is never held in memory
+    windows = client.date_windows(startDate, endDate, window_days) if window_days else [(startDate, endDate)]
+    conn = store.connect()
+    batch = []
+    try:
+        for start, end in windows:
+            params = {"sportId": 1, "gameType": "R", "startDate": start, "endDate": end}
+            for game in stream.iter_games("schedule", params=params):
+                batch.append(game)
+                if len(batch) >= store.BATCH_SIZE:
+                    store.insert_game_records(conn, batch)
+                    batch = []
+                yield game
+        store.insert_game_records(conn, batch)
+    finally:
+        conn.close()
+
+def get_league_wins_losses(startDate, endDate, window_days=None, stream_games=False):
+    """
+    Results for every team from one league-wide schedule pull.
+    Completed games are collected in one pass into a compact GameLog, and
+    {team name: results DataFrame} is returned. With stream_games the schedule is
+    parsed incrementally instead of decoded in one piece.
+    """
+    if stream_games:
+        games = stream_league_games(startDate, endDate, window_days)
     else:
-        print("No results found for the team.")
\ No newline at end of file
+        dates = get_schedule_dates(startDate, endDate, window_days=window_days)
+        if dates is None:
+            return None
+        games = (matchup for game in dates for matchup in game.games)
+    log = gamelog.GameLog()
+    try:
+        log.extend(matchup for matchup in games if is_final(matchup))
+    except requests.RequestException as e:
+        print(f"Failed to fetch schedule data: {e}")
+        return None
+    return {name: log.team_results(team_id) for team_id, name in log.team_names.items()}
+
+def results_to_dataframe(results):
+    if isinstance(results, pd.DataFrame):
+        return results
+    df = pd.DataFrame(results, columns=RESULT_COLUMNS)
+    df["Win"] = df["Win"].apply(lambda x: "W" if x else "L")
+    return df
+
+def team_results_path(team):
+    return os.path.join(OUTPUT_DIR, f"{team.replace(' ', '_')}_season_results.csv")
+
+def save_team_results(team, results):
+    df = results_to_dataframe(results)
+    storage.write_table(df, team_results_path(team), table="season_results")
+    print(f"Season results for {team} saved to {team.replace(' ', '_')}_season_results.csv")
+
+def tracker_state_path(team):
+    return os.path.join(TRACKER_DIR, f"{team.replace(' ', '_')}.json")
+
+def track_team(team, team_id, startDate, today):
+    """
+    Update a team's results file incrementally: only the window from the last stored
+    final game (or the earliest game that was not final last time) up to today is fetched.
+    Rows and pending dates from before startDate belong to an earlier season and are dropped.
+    """
+    path = team_results_path(team)
+    state_path = tracker_state_path(team)
+    recheck_from = startDate
+    stored = pd.DataFrame(columns=RESULT_COLUMNS)
+    if os.path.exists(path):
+        stored = storage.read_table(path, table="season_results")
+        stored = stored[stored["Date"] >= pd.Timestamp(startDate)]
+        if not stored.empty:
+            recheck_from = max(stored["Date"].max().date().isoformat(), startDate)
+        if os.path.exists(state_path):
+            with open(state_path) as file:
+                pending_from = json.load(file).get("pending_from")
+            if pending_from and pending_from >= startDate:
+                recheck_from = min(recheck_from, pending_from)
+
+    games = get_schedule_dates(recheck_from, today, team_id=team_id)
+    if games is None:
+        print("Failed to fetch team data")
+        return None
+    results, pending_dates = collect_team_games(games, team_id)
+
+    # Everything from recheck_from on was just refetched, so it replaces what was stored
+    kept = stored[stored["Date"] < pd.Timestamp(recheck_from)]
+    new = storage.apply_schema(results_to_dataframe(results), "season_results")
+    df = pd.concat([kept, new], ignore_index=True) if not kept.empty else new
+    storage.write_table(df, path, table="season_results")
+
+    os.makedirs(TRACKER_DIR, exist_ok=True)
+    with open(state_path, "w") as file:
+        json.dump({"pending_from": min(pending_dates) if pending_dates else None}, file)
+    print(f"Checked {recheck_from} to {today}: {len(results)} final game(s), {len(pending_dates)} not final yet")
+    return df
+
+def save_league_results(league_results, long_table=False):
+    if long_table:
+        frames = []
+        for team, results in sorted(league_results.items()):
+            df = results_to_dataframe(results)
+            df.insert(0, "Team", team)
+            frames.append(df)
+        storage.write_table(pd.concat(frames, ignore_index=True), os.path.join(OUTPUT_DIR, "MLB_season_results.csv"), table="season_results")
+        print(f"Season results for {len(frames)} teams saved to MLB_season_results.csv")
+    else:
+        for team, results in sorted(league_results.items()):
+            save_team_results(team, results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Save current regular-season results")
+    parser.add_argument("--team", default="Toronto Blue Jays", help="team to track (ignored with --all)")
+    parser.add_argument("--all", action="store_true", help="build results for every team from one schedule pull")
+    parser.add_argument("--long", action="store_true", help="with --all, write one long table instead of one file per team")
+    parser.add_argument("--stream", action="store_true", help="with --all, parse the schedule incrementally to keep memory flat")
+    parser.add_argument("--track", action="store_true", help="only fetch games since the last stored result and append them")
+    parser.add_argument("--window-days", type=int, default=None, help="with --all, fetch the season in date windows of this size")
+    args = parser.parse_args()
+
+    today = pd.Timestamp.now().date()
+    season = today.year
+    startDate, endDate = get_season_dates(season)
+    if startDate and endDate:
+        print(f"Season {season} starts on {startDate} and ends on {endDate}. Today's date is {today}.")
+
+    if args.all:
+        league_results = get_league_wins_losses(startDate, today, window_days=args.window_days, stream_games=args.stream)
+        if league_results:
+            save_league_results(league_results, long_table=args.long)
+        else:
+            print("No results found for the league.")
+    else:
+        team = args.team
+        team_id = get_team_id(team)
+        print(f"Team ID for {team}: {team_id}")
+
+        if team_id and args.track:
+            track_team(team, team_id, startDate, today)
+        elif team_id:
+            results = get_team_wins_losses(team_id, startDate, today)
+            if results:
+                save_team_results(team, results)
+            else:
+                print("No results found for the team.")
@@ -1,8 +1,12 @@
-import pandas as pd
 import folium
+import json
 import os
-from math import radians, sin, cos, sqrt, atan2
+import sys
 from branca.element import Template, MacroElement
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlbapi import storage
+import layout
+import paths
 
 # Clear console
 os.system('cls' if os.name == 'nt' else 'clear')
@@ -12,7 +16,7 @@ DATA_PATH = 'MLB.csv'
 OUTPUT_PATH = '../index.html'
 
 # Load data
-mlb_df = pd.read_csv(DATA_PATH)
+mlb_df = storage.read_table(DATA_PATH, table="map")
 
 # League colors
 league_colors = {
@@ -20,80 +24,41 @@ league_colors = {
     'National': 'blue'
 }
 
-MIN_DISTANCE_KM = 140 # minimum distance in km to avoid overlap
-ITERATIONS = 2 # the higher, the more iterations for separation
-DIV_FACTOR = 60 # the lower, the more separation
+MIN_DISTANCE_PX = 36 # minimum distance between logo centres on screen, in pixels (logos are 30 px wide)
+ZOOM_LEVELS = range(3, 11) # zoom levels with their own precomputed marker positions
+ZOOM_START = 5
+TOLERANCE_PX = 0.5 # overlaps smaller than this count as separated
+DAMPING = 0.5 # share of each overlap removed per solver step (lower = steadier, slower)
+MAX_ITERATIONS = 500 # solver step budget
 
 # Define custom separation directions for specific team pairs
 # Format: (team1, team2): (angle_in_degrees, relative_strength)
+# team1 moves along the angle (0 = north, 90 = east) and team2 the opposite way;
+# strength 10 keeps the pair MIN_DISTANCE_PX apart, 20 twice as far, and so on
 custom_directions = {    
-    ("Milwaukee Brewers", "Chicago Cubs"): (150 , 20),
+    ("Chicago Cubs", "Milwaukee Brewers"): (150 , 20),
     ("Chicago White Sox", "Chicago Cubs"): (250 , 10),
 
     # New York teams are diagonal north
     ("New York Yankees", "New York Mets"): (330, 20),
     
     # Los Angeles teams
-    ("Los Angeles Dodgers", "Los Angeles Angels"): (90, 20),
+    ("Los Angeles Angels", "Los Angeles Dodgers"): (90, 20),
     ("Los Angeles Dodgers", "San Diego Padres"): (90, 20),
 
     # Bay Area teams
-    ("San Francisco Giants", "Athletics"): (100, 15),
+    ("Athletics", "San Francisco Giants"): (100, 15),
 
     ("Baltimore Orioles", "Washington Nationals"): (300, 15)
 } 
 
-division_orders = {
-    "American Central": [
-        "Minnesota Twins",
-        "Chicago White Sox",
-        "Kansas City Royals",
-        "Chicago White Sox",
-        "Cleveland Guardians", 
-        "Detroit Tigers", 
-    ],
-    "American East": [
-        "Toronto Blue Jays",
-        "New York Yankees",
-        "Boston Red Sox",
-        "New York Yankees",
-        "Baltimore Orioles",
-        "Tampa Bay Rays"
-    ],
-    "American West": [
-        "Texas Rangers",
-        "Houston Astros",
-        "Los Angeles Angels",
-        "Athletics",
-        "Seattle Mariners",
-    ],
-    "National Central": [
-        "Milwaukee Brewers",
-        "Chicago Cubs",
-        "Cincinnati Reds",
-        "Pittsburgh Pirates",
-        "Cincinnati Reds",
-        "St. Louis Cardinals"
-    ],
-    "National East": [
-        "Miami Marlins",
-        "Atlanta Braves",
-        "Washington Nationals",
-        "New York Mets",
-        "Philadelphia Phillies",
-    ],
-    "National West": [
-        "Colorado Rockies",
-        "Arizona Diamondbacks",
-        "San Diego Padres",
-        "Los Angeles Dodgers",
-        "San Francisco Giants"
-    ]
-}
+# Teams sharing these columns are joined by one path, drawn in the order that makes it shortest
+# (e.g. ['League'] for one path per league)
+PATH_GROUPING = ['League', 'Division']
 
 
 # Create map
-map = folium.Map(location=[38, -97], zoom_start=5, tiles='CartoDB positron')
+map = folium.Map(location=[38, -97], zoom_start=ZOOM_START, tiles='CartoDB positron')
 
 map.fit_bounds([[50 , -100], [30, -100]])
 legend_html = """
@@ -116,97 +81,30 @@ legend = MacroElement()
 legend._template = Template(legend_html)
 map.get_root().add_child(legend)
 
-# Haversine distance calculation
-def haversine_distance(p1, p2):
-    lat1, lon1 = radians(p1[0]), radians(p1[1])
-    lat2, lon2 = radians(p2[0]), radians(p2[1])
-    
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    
-    return 6371 * c  # Earth radius in km
-
-# Improved function to calculate offset positions for nearby markers
-def calculate_offsets(teams_df, min_distance_km=MIN_DISTANCE_KM):
+# Offsets for markers that are too close to each other, solved in screen pixels for every zoom level (layout.py)
+def calculate_offsets(teams_df, min_distance_px=MIN_DISTANCE_PX):
     """
-    Calculate offsets for markers that are too close to each other.
-    Returns a dictionary with team names as keys and offset coordinates as values.
+    Calculate offsets for markers that are too close to each other at each zoom level.
+    Returns {zoom: {team name: (lat offset, lon offset)}}.
     """
-    offsets = {}
-    team_coords = {}
-    
-    # Get all team coordinates and initialize offsets
-    for _, row in teams_df.iterrows():
-        team_coords[row['Team']] = (row['Latitude'], row['Longitude'])
-        offsets[row['Team']] = (0, 0)  # Initialize with no offset
-    
-    # Create list of teams for iteration
-    team_names = list(team_coords.keys())
-    
-    # Multiple iterations for better separation
-    for iteration in range(ITERATIONS):  # Run multiple passes for better results
-        for i in range(len(team_names)):
-            team1 = team_names[i]
-            coord1 = team_coords[team1]
-            
-            for j in range(i+1, len(team_names)):
-                team2 = team_names[j]
-                coord2 = team_coords[team2]
-                    
-                distance = haversine_distance(coord1, coord2)
-                
-                if distance < min_distance_km:
-                    # Check if we have a custom direction for this pair
-                    custom_key1 = (team1, team2)
-                    custom_key2 = (team2, team1)
-                    
-                    if custom_key1 in custom_directions:
-                        angle_degrees, strength_multiplier = custom_directions[custom_key1]
-                    elif custom_key2 in custom_directions:
-                        angle_degrees, strength_multiplier = custom_directions[custom_key2]
-                    else:
-                        # Default behavior: push directly away from each other
-                        dx = coord2[1] - coord1[1]
-                        dy = coord2[0] - coord1[0]
-                        
-                        # Normalize the direction (avoid division by zero)
-                        magnitude = max(sqrt(dx*dx + dy*dy), 0.0001)
-                        dx /= magnitude
-                        dy /= magnitude
-                        
-                        # Calculate push force
-                        push_force = (min_distance_km - distance) / DIV_FACTOR
-
-                        # Apply push in opposite directions
-                        offsets[team1] = (offsets[team1][0] - dy * push_force, 
-                                         offsets[team1][1] - dx * push_force)
-                        offsets[team2] = (offsets[team2][0] + dy * push_force, 
-                                         offsets[team2][1] + dx * push_force)
-                        continue
-                    
-                    # Use custom direction
-                    angle_radians = radians(angle_degrees)
-                    
-                    # Calculate push force with custom strength
-                    push_force = (min_distance_km - distance) / 20 * strength_multiplier
-                    
-                    # Convert to degrees (approx 111 km per degree)
-                    lat_offset = push_force * cos(angle_radians) / 111
-                    lon_offset = push_force * sin(angle_radians) / (111 * cos(radians(coord1[0])))
-                    
-                    # Apply custom offset (team1 gets the defined direction, team2 gets opposite)
-                    offsets[team1] = (offsets[team1][0] + lat_offset, 
-                                     offsets[team1][1] + lon_offset)
-                    offsets[team2] = (offsets[team2][0] - lat_offset, 
-                                     offsets[team2][1] - lon_offset)
-    
-    return offsets
-
-# Calculate offsets for all teams
-marker_offsets = calculate_offsets(mlb_df)
+    pyramid = layout.offset_pyramid(
+        teams_df['Latitude'].to_numpy(), teams_df['Longitude'].to_numpy(), teams_df['Team'].tolist(),
+        ZOOM_LEVELS, min_distance_px, custom_directions,
+        tolerance_px=TOLERANCE_PX, damping=DAMPING, max_iterations=MAX_ITERATIONS,
+    )
+    for zoom, result in pyramid.items():
+        status = "converged" if result.converged else "stopped at the iteration budget"
+        print(f"Zoom {zoom}: {status} after {result.iterations} iterations in {result.seconds * 1000:.1f} ms; "
+              f"{result.residual_pairs} overlapping pair(s) left (largest {max(result.max_overlap, 0):.1f} px)")
+    return {
+        zoom: dict(zip(teams_df['Team'], zip(result.lat_offsets, result.lon_offsets)))
+        for zoom, result in pyramid.items()
+    }
+
+# Calculate offsets for all teams at every zoom level; markers start at ZOOM_START
+zoom_offsets = calculate_offsets(mlb_df)
+marker_offsets = zoom_offsets[ZOOM_START]
+team_markers = {}
 
 # Add team markers with offsets
 for _, row in mlb_df.iterrows():
@@ -236,16 +134,20 @@ for _, row in mlb_df.iterrows():
         popup_anchor=(0, -15)
     )
     
-    folium.Marker(
+    team_markers[row['Team']] = folium.Marker(
         location=[lat, lon],
         popup=popup_text,
         tooltip=row['Team'],
         icon=logo_icon
     ).add_to(map)
 
-# Create division paths
-mlb_df['FullDivision'] = mlb_df['League'] + ' ' + mlb_df['Division']
-
+# Create division paths: the shortest line through each group's ballparks, from one distance matrix
+mlb_df['PathGroup'] = mlb_df[PATH_GROUPING].astype(str).agg(' '.join, axis=1)
+distance_km = layout.haversine_matrix(mlb_df['Latitude'].to_numpy(), mlb_df['Longitude'].to_numpy())
+group_orders = paths.group_paths(
+    {group: rows.tolist() for group, rows in mlb_df.groupby('PathGroup', sort=False).indices.items()},
+    distance_km,
+)
 
 # Create a dictionary for team coordinates with offsets
 team_offset_coords = {}
@@ -256,42 +158,24 @@ for _, row in mlb_df.iterrows():
         row['Longitude'] + offset[1]
     )
 
-for division in mlb_df['FullDivision'].unique():
-    division_teams = mlb_df[mlb_df['FullDivision'] == division]
-    
-    if len(division_teams) < 2:
+division_paths = [] # (PolyLine, team names along it)
+for group, rows in group_orders.items():
+    if len(rows) < 2:
         continue
-        
+
     # Get league color
-    league = division_teams['League'].iloc[0]
+    league = mlb_df['League'].iloc[rows[0]]
     line_color = league_colors.get(league, 'black')
-    
-    # Check if custom order is defined
-    custom_order = division_orders.get(division, [])
-    path = []
-    
-    if custom_order:
-        # If a custom order is defined, use it but verify teams exist
-        for team in custom_order:
-            if team in team_offset_coords:
-                path.append(team_offset_coords[team])
-            else:
-                print(f"Warning: Team '{team}' not found in division '{division}'")
-    else:
-        # Default case: use the original order from the CSV with offsets
-        for _, team in division_teams.iterrows():
-            if team['Team'] in team_offset_coords:
-                path.append(team_offset_coords[team['Team']])
-
-    # Add path to map only if we have at least 2 points
-    if len(path) >= 2:
-        folium.PolyLine(locations=path, color=line_color, weight=2.5, opacity=0.8).add_to(map)
-    else:
-        print(f"Warning: Not enough valid points for division '{division}' to draw a line")
+
+    path_teams = mlb_df['Team'].iloc[rows].tolist()
+    path = [team_offset_coords[team] for team in path_teams]
+    line = folium.PolyLine(locations=path, color=line_color, weight=2.5, opacity=0.8).add_to(map)
+    division_paths.append((line, path_teams))
+    print(f"{group}: {' → '.join(path_teams)} ({paths.path_length(rows, distance_km):.0f} km)")
 
 ###################### IDEA: change the opacity of divisions ######################
 # legend_items = []
-# for division, teams in division_orders.items():
+# for division in group_orders:
 #     league = division.split()[0]
 #     color = league_colors.get(league, "black")
 #     legend_items.append(f'<i style="color:{color};">&#8212;</i> {division}')
@@ -317,6 +201,52 @@ for division in mlb_df['FullDivision'].unique():
 
 
 
+# Switch markers and division paths to the precomputed positions of the current zoom level.
+# The browser only looks positions up on zoomend; all layout work happened above.
+teams = list(team_markers)
+team_index = {team: k for k, team in enumerate(teams)}
+zoom_layout = {
+    "minZoom": min(ZOOM_LEVELS),
+    "maxZoom": max(ZOOM_LEVELS),
+    "markers": [team_markers[team].get_name() for team in teams],
+    "paths": [[line.get_name(), [team_index[team] for team in path_teams]] for line, path_teams in division_paths],
+    "zooms": {
+        zoom: [
+            [round(row['Latitude'] + offsets[row['Team']][0], 5), round(row['Longitude'] + offsets[row['Team']][1], 5)]
+            for _, row in mlb_df.set_index('Team', drop=False).loc[teams].iterrows()
+        ]
+        for zoom, offsets in zoom_offsets.items()
+    },
+}
+
+zoom_switch_js = """
+{% macro script(this, kwargs) %}
+(function() {
+    var map = {{ this._parent.get_name() }};
+    var layout = {{ this.layout }};
+    var markers = layout.markers.map(function(name) { return window[name]; });
+    var paths = layout.paths.map(function(path) { return [window[path[0]], path[1]]; });
+
+    function showZoomPositions() {
+        var zoom = Math.min(Math.max(Math.round(map.getZoom()), layout.minZoom), layout.maxZoom);
+        var positions = layout.zooms[zoom];
+        markers.forEach(function(marker, k) { marker.setLatLng(positions[k]); });
+        paths.forEach(function(path) {
+            path[0].setLatLngs(path[1].map(function(k) { return positions[k]; }));
+        });
+    }
+
+    map.on('zoomend', showZoomPositions);
+    showZoomPositions();
+})();
+{% endmacro %}
+"""
+
+zoom_switch = MacroElement()
+zoom_switch._template = Template(zoom_switch_js)
+zoom_switch.layout = json.dumps(zoom_layout, separators=(',', ':'))
+map.add_child(zoom_switch)
+
 # Save map
 map.save(OUTPUT_PATH)
 print(f"Success! Map has been saved to '{OUTPUT_PATH}'")
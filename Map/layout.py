@@ -0,0 +1,336 @@
+# Marker separation for the MLB map, computed with NumPy on whole arrays.
+# Close pairs are found with a uniform grid (over points on the unit sphere, or over screen
+# pixels), so only markers in neighbouring cells are ever compared and the cost grows with
+# the number of markers rather than its square. relax() then moves all overlapping pairs
+# apart at once, with damping, until no overlap is larger than the tolerance or the
+# iteration budget runs out.
+#   solve_offsets()        separation in km on the globe
+#   solve_pixel_offsets()  separation in Web-Mercator pixels at one zoom level
+#   offset_pyramid()       pixel solutions for a range of zoom levels, for the map page
+
+import argparse
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111 # approximate length of one degree of latitude
+
+TILE_SIZE = 256 # Web-Mercator world width in pixels at zoom 0
+
+TOLERANCE_KM = 1.0 # overlaps up to this size count as solved
+TOLERANCE_PX = 0.5
+DAMPING = 0.5 # fraction of each overlap removed per iteration
+MAX_ITERATIONS = 500
+CUSTOM_STRENGTH_UNIT = 10 # a custom pair with this strength is kept min_distance apart
+
+
+def haversine_matrix(lat, lon):
+    """
+    Great-circle distance in km between every pair of points (degrees in, n x n array out).
+    """
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_pairs(lat, lon, i, j):
+    """
+    Great-circle distance in km between points i[k] and j[k] (degrees in).
+    """
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    a = np.sin((lat[i] - lat[j]) / 2) ** 2 + np.cos(lat[i]) * np.cos(lat[j]) * np.sin((lon[i] - lon[j]) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def unit_vectors(lat, lon):
+    # Points as (x, y, z) on the unit sphere, where straight-line and great-circle distance agree in order
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lon = np.radians(np.asarray(lon, dtype=float))
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+def grid_pairs(points, cell):
+    """
+    Candidate pairs (i, j), i < j, of points (an n x d array) in the same or adjacent cells of
+    a grid with side `cell`. Every pair closer than `cell` is among them.
+    """
+    n, dimensions = points.shape
+    cells = np.floor(points / max(cell, 1e-9)).astype(np.int64)
+    cells -= cells.min(axis=0) - 1 # leave room for the -1 neighbour offset
+    dims = cells.max(axis=0) + 2
+
+    def encode(c):
+        key = c[:, 0]
+        for axis in range(1, dimensions):
+            key = key * dims[axis] + c[:, axis]
+        return key
+
+    order = np.argsort(encode(cells), kind="stable")
+    sorted_keys = encode(cells)[order]
+    pair_i = [np.zeros(0, dtype=np.int64)]
+    pair_j = [np.zeros(0, dtype=np.int64)]
+    neighbours = np.array(np.meshgrid(*[[-1, 0, 1]] * dimensions)).T.reshape(-1, dimensions)
+    for offset in neighbours:
+        keys = encode(cells + offset)
+        start = np.searchsorted(sorted_keys, keys, "left")
+        counts = np.searchsorted(sorted_keys, keys, "right") - start
+        total = counts.sum()
+        if total == 0:
+            continue
+        # Expand every point into (point, each point of the neighbouring cell)
+        first = np.cumsum(counts) - counts
+        i = np.repeat(np.arange(n), counts)
+        j = order[np.repeat(start, counts) + np.arange(total) - np.repeat(first, counts)]
+        keep = i < j
+        pair_i.append(i[keep])
+        pair_j.append(j[keep])
+    return np.concatenate(pair_i), np.concatenate(pair_j)
+
+
+def _sorted_pairs(i, j, distance, radius):
+    keep = distance < radius
+    i, j, distance = i[keep], j[keep], distance[keep]
+    ordered = np.lexsort((j, i))
+    return i[ordered], j[ordered], distance[ordered]
+
+
+def close_pairs(lat, lon, radius_km):
+    """
+    (i, j, distance km) for every pair i < j closer than radius_km, sorted by (i, j).
+    Points are hashed into a grid of cubes on the unit sphere whose side is the chord of
+    radius_km, so only markers in the same or adjacent cells are measured.
+    """
+    if len(lat) < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    chord = 2 * np.sin(min(radius_km / EARTH_RADIUS_KM, np.pi) / 2)
+    i, j = grid_pairs(unit_vectors(lat, lon), chord)
+    return _sorted_pairs(i, j, haversine_pairs(lat, lon, i, j), radius_km)
+
+
+def plane_pairs(x, y, radius):
+    """
+    (i, j, distance) for every pair i < j of planar points closer than radius, sorted by (i, j).
+    """
+    if len(x) < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    i, j = grid_pairs(np.column_stack((x, y)), radius)
+    return _sorted_pairs(i, j, np.hypot(x[j] - x[i], y[j] - y[i]), radius)
+
+
+def mercator_pixels(lat, lon, zoom):
+    # Web-Mercator world pixel coordinates (x east, y south) at a zoom level
+    scale = TILE_SIZE * 2 ** zoom
+    lat = np.radians(np.clip(np.asarray(lat, dtype=float), -85.05112878, 85.05112878))
+    x = (np.asarray(lon, dtype=float) + 180) / 360 * scale
+    y = (1 - np.log(np.tan(lat) + 1 / np.cos(lat)) / np.pi) / 2 * scale
+    return x, y
+
+
+def mercator_latlon(x, y, zoom):
+    scale = TILE_SIZE * 2 ** zoom
+    lon = np.asarray(x, dtype=float) / scale * 360 - 180
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y, dtype=float) / scale))))
+    return lat, lon
+
+
+def custom_pair_arrays(names, custom_directions):
+    # Index arrays (first team, second team, angle, strength) for the custom pairs present in `names`
+    position = {name: k for k, name in enumerate(names)}
+    rows = [
+        (position[first], position[second], angle, strength)
+        for (first, second), (angle, strength) in custom_directions.items()
+        if first in position and second in position
+    ]
+    if not rows:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)
+    first, second, angle, strength = (np.array(column) for column in zip(*rows))
+    return first.astype(np.int64), second.astype(np.int64), angle.astype(float), strength.astype(float)
+
+
+class SphereSpace:
+    """
+    Markers on the globe: positions in degrees, distances and moves in km (x east, y north).
+    """
+    north = 1
+
+    def __init__(self, lat, lon):
+        self.lat = np.array(lat, dtype=float)
+        self.lon = np.array(lon, dtype=float)
+
+    def pairs(self, radius):
+        return close_pairs(self.lat, self.lon, radius)
+
+    def distance(self, i, j):
+        return haversine_pairs(self.lat, self.lon, i, j)
+
+    def vector(self, i, j):
+        # From i to j in a local east/north frame around each pair
+        cos_mid = np.cos(np.radians((self.lat[i] + self.lat[j]) / 2))
+        return (self.lon[j] - self.lon[i]) * KM_PER_DEGREE * cos_mid, (self.lat[j] - self.lat[i]) * KM_PER_DEGREE
+
+    def move(self, dx, dy):
+        self.lat += dy / KM_PER_DEGREE
+        self.lon += dx / (KM_PER_DEGREE * np.cos(np.radians(self.lat)))
+
+    def latlon(self):
+        return self.lat, self.lon
+
+
+class MercatorSpace:
+    """
+    Markers on the Web-Mercator map at one zoom level: everything in screen pixels (x east, y south).
+    """
+    north = -1
+
+    def __init__(self, lat, lon, zoom):
+        self.zoom = zoom
+        self.x, self.y = mercator_pixels(lat, lon, zoom)
+
+    def pairs(self, radius):
+        return plane_pairs(self.x, self.y, radius)
+
+    def distance(self, i, j):
+        return np.hypot(self.x[j] - self.x[i], self.y[j] - self.y[i])
+
+    def vector(self, i, j):
+        return self.x[j] - self.x[i], self.y[j] - self.y[i]
+
+    def move(self, dx, dy):
+        self.x += dx
+        self.y += dy
+
+    def latlon(self):
+        return mercator_latlon(self.x, self.y, self.zoom)
+
+
+@dataclass
+class Layout:
+    lat_offsets: np.ndarray # degrees
+    lon_offsets: np.ndarray
+    iterations: int
+    converged: bool
+    residual_pairs: int # pairs still closer than their target by more than the tolerance
+    max_overlap: float # in the solver's unit (km or pixels)
+    seconds: float
+
+
+def relax(space, names, min_distance, custom_directions=None, tolerance=TOLERANCE_KM,
+          damping=DAMPING, max_iterations=MAX_ITERATIONS):
+    """
+    Move the markers of `space` apart until no two are closer than min_distance (within
+    tolerance). Every iteration measures all overlapping pairs at the current positions and
+    moves both markers of each pair apart by damping * half the overlap, all at once, so the
+    result does not depend on row order. Pairs in custom_directions, {(team1, team2): (angle,
+    strength)}, are separated along a fixed compass angle (team1 moves that way, team2 the
+    opposite way) until they are min_distance * strength / CUSTOM_STRENGTH_UNIT apart.
+    Returns (iterations, converged, residual pairs, largest overlap).
+    """
+    names = list(names)
+    n = len(names)
+    ci, cj, angle, strength = custom_pair_arrays(names, custom_directions or {})
+    custom_target = min_distance * strength / CUSTOM_STRENGTH_UNIT
+    # Unit vector from team1 towards team2: team1 moves the other way
+    angle = np.radians(angle)
+    custom_ux = -np.sin(angle)
+    custom_uy = -np.cos(angle) * space.north
+    custom_keys = np.minimum(ci, cj) * n + np.maximum(ci, cj)
+
+    iterations = 0
+    while True:
+        i, j, distance = space.pairs(min_distance)
+        default = ~np.isin(i * n + j, custom_keys)
+        i, j = i[default], j[default]
+        overlap = min_distance - distance[default]
+        ux, uy = space.vector(i, j)
+        norm = np.hypot(ux, uy)
+        # Markers on the same spot get a fixed, pair-specific direction
+        spread = (i + j) * 2.399963 # golden angle in radians
+        same = norm < 1e-9
+        ux = np.where(same, np.cos(spread), ux / np.where(same, 1, norm))
+        uy = np.where(same, np.sin(spread), uy / np.where(same, 1, norm))
+
+        custom_overlap = custom_target - space.distance(ci, cj)
+        active = custom_overlap > 0
+        i = np.concatenate((i, ci[active]))
+        j = np.concatenate((j, cj[active]))
+        ux = np.concatenate((ux, custom_ux[active]))
+        uy = np.concatenate((uy, custom_uy[active]))
+        overlap = np.concatenate((overlap, custom_overlap[active]))
+
+        residual = overlap > tolerance
+        if not residual.any() or iterations >= max_iterations:
+            break
+        iterations += 1
+
+        step = damping * overlap / 2
+        move_x = np.zeros(n)
+        move_y = np.zeros(n)
+        np.add.at(move_x, i, -ux * step)
+        np.add.at(move_x, j, ux * step)
+        np.add.at(move_y, i, -uy * step)
+        np.add.at(move_y, j, uy * step)
+        space.move(move_x, move_y)
+
+    max_overlap = float(overlap.max()) if len(overlap) else 0.0
+    return iterations, not residual.any(), int(residual.sum()), max_overlap
+
+
+def _layout(space, lat, lon, start, stats):
+    new_lat, new_lon = space.latlon()
+    return Layout(new_lat - np.asarray(lat, dtype=float), new_lon - np.asarray(lon, dtype=float),
+                  *stats, seconds=time.perf_counter() - start)
+
+
+def solve_offsets(lat, lon, names, min_distance_km, custom_directions=None, tolerance_km=TOLERANCE_KM,
+                  damping=DAMPING, max_iterations=MAX_ITERATIONS):
+    """
+    Offsets in degrees that keep markers at least min_distance_km apart on the globe.
+    """
+    start = time.perf_counter()
+    space = SphereSpace(lat, lon)
+    stats = relax(space, names, min_distance_km, custom_directions, tolerance_km, damping, max_iterations)
+    return _layout(space, lat, lon, start, stats)
+
+
+def solve_pixel_offsets(lat, lon, names, zoom, min_distance_px, custom_directions=None,
+                        tolerance_px=TOLERANCE_PX, damping=DAMPING, max_iterations=MAX_ITERATIONS):
+    """
+    Offsets in degrees that keep markers at least min_distance_px apart on screen at `zoom`.
+    """
+    start = time.perf_counter()
+    space = MercatorSpace(lat, lon, zoom)
+    stats = relax(space, names, min_distance_px, custom_directions, tolerance_px, damping, max_iterations)
+    return _layout(space, lat, lon, start, stats)
+
+
+def offset_pyramid(lat, lon, names, zooms, min_distance_px, custom_directions=None, **solver_options):
+    """
+    {zoom: Layout} with a pixel-space solution for every zoom level in `zooms`.
+    """
+    return {
+        zoom: solve_pixel_offsets(lat, lon, names, zoom, min_distance_px, custom_directions, **solver_options)
+        for zoom in zooms
+    }
+
+
+if __name__ == "__main__":
+    # Time the layout on random venues over the continental US
+    parser = argparse.ArgumentParser(description="Benchmark marker separation on random points")
+    parser.add_argument("--points", type=int, nargs="+", default=[30, 400, 5000])
+    parser.add_argument("--min-distance", type=float, default=140)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    for n in args.points:
+        lat = rng.uniform(25, 49, n)
+        lon = rng.uniform(-124, -67, n)
+        names = [f"Venue {k}" for k in range(n)]
+        pairs = len(close_pairs(lat, lon, args.min_distance)[0])
+        layout = solve_offsets(lat, lon, names, args.min_distance)
+        print(f"{n:>6} points, {pairs:>7} close pairs: {layout.iterations:>4} iterations, "
+              f"{layout.residual_pairs} left, {layout.seconds * 1000:8.1f} ms")
@@ -0,0 +1,200 @@
+# Shortest paths through groups of teams (division lines on the map).
+# All distances come from one precomputed matrix. Groups of up to HELD_KARP_MAX teams are
+# solved exactly with the Held-Karp dynamic program; larger groups start from a
+# nearest-neighbour tour and are improved with 2-opt and Or-opt moves, each scored in O(1)
+# from the few edges it changes instead of re-summing the whole path.
+#
+# An open path (a line with free ends) is found as a closed tour through one extra "dummy"
+# stop that is zero km from everyone; cutting the tour at the dummy gives the path.
+
+import argparse
+import time
+
+import numpy as np
+
+HELD_KARP_MAX = 12 # groups up to this size are solved exactly (2^n * n^2 work)
+OR_OPT_SEGMENTS = (1, 2, 3) # segment lengths tried by Or-opt
+
+
+def path_length(order, distance, closed=False):
+    order = np.asarray(order)
+    length = distance[order[:-1], order[1:]].sum()
+    if closed and len(order) > 1:
+        length += distance[order[-1], order[0]]
+    return float(length)
+
+
+def _with_dummy(distance):
+    # Add stop 0 at zero distance from everyone, shifting the real stops to 1..n
+    n = len(distance)
+    extended = np.zeros((n + 1, n + 1))
+    extended[1:, 1:] = distance
+    return extended
+
+
+def held_karp(distance):
+    """
+    Exact shortest closed tour starting and ending at stop 0, as a list of stops.
+    """
+    n = len(distance)
+    if n <= 2:
+        return list(range(n))
+    others = n - 1
+    full = (1 << others) - 1
+    # cost[mask, j]: shortest path from 0 through the stops in mask (bit k = stop k + 1), ending at j + 1
+    cost = np.full((1 << others, others), np.inf)
+    parent = np.full((1 << others, others), -1, dtype=np.int64)
+    cost[1 << np.arange(others), np.arange(others)] = distance[0, 1:]
+    between = distance[1:, 1:]
+    for mask in range(1, full + 1):
+        members = [j for j in range(others) if mask >> j & 1]
+        if len(members) < 2:
+            continue
+        for j in members:
+            previous = mask ^ (1 << j)
+            candidates = cost[previous] + between[:, j]
+            k = int(np.argmin(candidates))
+            cost[mask, j] = candidates[k]
+            parent[mask, j] = k
+
+    last = int(np.argmin(cost[full] + distance[1:, 0]))
+    tour = []
+    mask = full
+    while last >= 0:
+        tour.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    return [0] + tour[::-1]
+
+
+def nearest_neighbour(distance, start=0):
+    n = len(distance)
+    tour = [start]
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    for _ in range(n - 1):
+        candidates = np.where(visited, np.inf, distance[tour[-1]])
+        nearest = int(np.argmin(candidates))
+        tour.append(nearest)
+        visited[nearest] = True
+    return tour
+
+
+def two_opt(tour, distance):
+    """
+    Apply the best improving 2-opt move until none is left. Reversing tour[i+1..k] replaces
+    edges (a, b) and (c, e) with (a, c) and (b, e), so every move is scored from four
+    distances; all moves of one pass are scored at once with NumPy.
+    """
+    tour = np.asarray(tour)
+    n = len(tour)
+    if n < 4:
+        return tour.tolist()
+    i, k = np.triu_indices(n, k=2)
+    keep = ~((i == 0) & (k == n - 1)) # those two edges are adjacent in a closed tour
+    i, k = i[keep], k[keep]
+    while True:
+        a, b, c, e = tour[i], tour[i + 1], tour[k], tour[(k + 1) % n]
+        delta = distance[a, c] + distance[b, e] - distance[a, b] - distance[c, e]
+        best = int(np.argmin(delta))
+        if delta[best] >= -1e-9:
+            return tour.tolist()
+        tour[i[best] + 1:k[best] + 1] = tour[i[best] + 1:k[best] + 1][::-1]
+
+
+def or_opt(tour, distance, segments=OR_OPT_SEGMENTS):
+    """
+    Move runs of 1-3 consecutive stops to a better place in the tour (possibly reversed),
+    taking the first improving move until none is left. Each move is scored in O(1).
+    """
+    tour = list(tour)
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for length in segments:
+            if length >= n - 2:
+                continue
+            for start in range(n):
+                segment = [tour[(start + s) % n] for s in range(length)]
+                before = tour[(start - 1) % n]
+                after = tour[(start + length) % n]
+                removed = distance[before, segment[0]] + distance[segment[-1], after] - distance[before, after]
+                rest = [tour[(start + length + s) % n] for s in range(n - length)]
+                best_gain, best_move = 1e-9, None
+                for position in range(len(rest) - 1):
+                    p, q = rest[position], rest[position + 1]
+                    added = distance[p, segment[0]] + distance[segment[-1], q] - distance[p, q]
+                    added_reversed = distance[p, segment[-1]] + distance[segment[0], q] - distance[p, q]
+                    if removed - added > best_gain:
+                        best_gain, best_move = removed - added, (position, False)
+                    if removed - added_reversed > best_gain:
+                        best_gain, best_move = removed - added_reversed, (position, True)
+                if best_move is not None:
+                    position, reverse = best_move
+                    tour = rest[:position + 1] + (segment[::-1] if reverse else segment) + rest[position + 1:]
+                    improved = True
+                    break
+            if improved:
+                break
+    return tour
+
+
+def shortest_tour(distance):
+    """
+    Shortest (exact for small groups, 2-opt + Or-opt otherwise) closed tour starting at stop 0.
+    """
+    distance = np.asarray(distance, dtype=float)
+    if len(distance) <= HELD_KARP_MAX + 1:
+        return held_karp(distance)
+    tour = nearest_neighbour(distance)
+    while True:
+        length = path_length(tour, distance, closed=True)
+        tour = or_opt(two_opt(tour, distance), distance)
+        if path_length(tour, distance, closed=True) >= length - 1e-9:
+            break
+    # Rotate so the tour starts at stop 0 again
+    start = tour.index(0)
+    return tour[start:] + tour[:start]
+
+
+def shortest_path(distance, closed=False):
+    """
+    Order of the stops (indexes into `distance`) giving the shortest line through all of them,
+    or the shortest loop if closed=True.
+    """
+    n = len(distance)
+    if n <= 2:
+        return list(range(n))
+    if closed:
+        return shortest_tour(distance)
+    tour = shortest_tour(_with_dummy(np.asarray(distance, dtype=float)))
+    return [stop - 1 for stop in tour[1:]]
+
+
+def group_paths(groups, distance, closed=False):
+    """
+    {group: ordered row indexes} for every group of rows, using submatrices of one
+    precomputed distance matrix. `groups` maps a group name to the row indexes in it.
+    """
+    paths = {}
+    for group, rows in groups.items():
+        rows = np.asarray(rows)
+        order = shortest_path(distance[np.ix_(rows, rows)], closed)
+        paths[group] = rows[order].tolist()
+    return paths
+
+
+if __name__ == "__main__":
+    # Time the solvers on random stops
+    parser = argparse.ArgumentParser(description="Benchmark the path solvers on random points")
+    parser.add_argument("--points", type=int, nargs="+", default=[5, 10, 12, 50, 200])
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    for n in args.points:
+        points = rng.uniform(0, 1000, (n, 2))
+        distance = np.hypot(*(points[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+        start = time.perf_counter()
+        order = shortest_path(distance)
+        elapsed = time.perf_counter() - start
+        method = "Held-Karp" if n <= HELD_KARP_MAX else "2-opt + Or-opt"
+        print(f"{n:>5} stops ({method}): length {path_length(order, distance):9.1f} in {elapsed * 1000:8.1f} ms")
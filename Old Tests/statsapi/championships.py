@@ -1,16 +1,17 @@
-import requests
 from collections import Counter
 
 #clear the console
 import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from mlbapi import client
 os.system('cls' if os.name == 'nt' else 'clear')
 
 def get_world_series_champions(start_year=1903, end_year=2025):
     champions = []
 
     for year in range(start_year, end_year + 1):
-        url = f"https://statsapi.mlb.com/api/v1/schedule/postseason/series?season={year}"
-        response = requests.get(url)
+        response = client.get("schedule/postseason/series", params={"season": year})
         if response.status_code != 200:
             print(f"Failed to retrieve data for {year}")
             continue
@@ -1,12 +1,13 @@
 from prompt_toolkit import HTML
-import requests
 import pandas as pd
 import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlbapi import client, storage, store
 os.system('cls' if os.name == 'nt' else 'clear')
 
 def get_teams_info():
-    url = "https://statsapi.mlb.com/api/v1/teams"
-    response = requests.get(url)
+    response = client.get("teams")
     
     if response.status_code != 200:
         print("Failed to fetch teams data")
@@ -16,12 +17,14 @@ def get_teams_info():
     teams = data.get("teams", [])
     
     team_info = []
+    mlb_teams = []
     for team in teams:
         league_name = team.get("league", {}).get("name", "N/A")
 
         # Filter only American and National leagues
         if league_name not in ["American League", "National League"]:
             continue
+        mlb_teams.append(team)
 
         team_info.append({
             "id": team["id"],
@@ -38,13 +41,22 @@ def get_teams_info():
             "firstYearOfPlay": team.get("firstYearOfPlay", "N/A"),
             "yearsActive": pd.Timestamp.now().year - pd.to_datetime(team.get("firstYearOfPlay", "ERROR"), errors='coerce').year if team.get("firstYearOfPlay") else "N/A",
         })
-    
+
+
+    conn = store.connect()
+    store.insert_teams(conn, mlb_teams)
+    conn.close()
+
     return pd.DataFrame(team_info)
 
 def save_teams_info(df, filename, filetype="csv"):
     if filetype == "csv":
-        df.to_csv(filename, index=False)
+        # CSV export plus a typed Parquet copy alongside it
+        storage.write_table(df, filename, table="teams_info")
         print(f"Teams information saved to {filename}")
+    elif filetype == "parquet":
+        storage.write_table(df, filename, table="teams_info", csv=False)
+        print(f"Teams information saved to {storage.parquet_path(filename)}")
     elif filetype == "excel":
         df.to_excel(filename, index=False)
         print(f"Teams information saved to {filename}")
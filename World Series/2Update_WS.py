@@ -1,83 +1,197 @@
-import requests
+from collections import Counter
 from datetime import date
+import argparse
 import os
+import sys
+import pandas as pd
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mlbapi import archive, championships, client, franchises, schemas, storage, store
 os.system('cls' if os.name == 'nt' else 'clear')
 
-def get_world_series_winners(start_year=1903, end_year=date.today().year):
-    winners = {}
-    for year in range(start_year, end_year + 1):
-        url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&season={year}&gameTypes=W"
-        response = requests.get(url)
-        if response.status_code != 200:
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHAMPS_PATH = os.path.join(OUTPUT_DIR, "MLB_Champs.csv")
+LOSERS_PATH = os.path.join(OUTPUT_DIR, "MLB_Losers.csv")
+
+NO_WORLD_SERIES = "No World Series"
+NO_WORLD_SERIES_YET = "No World Series yet"
+DATA_NOT_AVAILABLE = "Data not available"
+
+# Game states that count as a played World Series game
+FINAL_STATES = ("final", "game over", "completed early")
+
+FIRST_WORLD_SERIES = 1903
+
+def fetch_world_series_schedules(years, max_workers=client.MAX_WORKERS):
+    # Request every season's World Series schedule in parallel, keyed back by year in order
+    years = list(years)
+    params = [{"sportId": 1, "season": year, "gameTypes": "W"} for year in years]
+    return dict(zip(years, client.get_many("schedule", params, max_workers=max_workers)))
+
+def empty_result(year, status):
+    return {"Year": year, "Winner": status, "Loser": status, "Score": "", "Games": 0}
+
+def parse_world_series(year, schedule, end_year):
+    """
+    Parse one season's World Series schedule (a schemas.Schedule record) in a single pass.
+    Returns a dict with Year, Winner, Loser, Score (final game, winner first) and Games played.
+    """
+    games = [game for day in schedule.dates for game in day.games]
+    played = [game for game in games if game.status.detailedState.lower() in FINAL_STATES]
+    if not played:
+        return empty_result(year, NO_WORLD_SERIES_YET if year == end_year else NO_WORLD_SERIES)
+
+    # Count game wins per team so an unfinished series is not reported as won
+    game_wins = Counter()
+    for game in played:
+        if game.winner():
+            game_wins[game.winner().team.name] += 1
+
+    final_game = played[-1]
+    away = final_game.teams.away
+    home = final_game.teams.home
+    winner_side, loser_side = (away, home) if away.isWinner else (home, away)
+
+    games_in_series = final_game.gamesInSeries
+    if games_in_series and game_wins[winner_side.team.name] < games_in_series // 2 + 1:
+        return empty_result(year, NO_WORLD_SERIES_YET)
+
+    return {
+        "Year": year,
+        "Winner": winner_side.team.name,
+        "Loser": loser_side.team.name,
+        "Score": f"{winner_side.score}-{loser_side.score}",
+        "Games": len(played),
+    }
+
+def get_world_series_results(years=None, end_year=date.today().year, max_workers=client.MAX_WORKERS):
+    # One download and one parse per season; winners and losers both come from this
+    if years is None:
+        years = range(FIRST_WORLD_SERIES, end_year + 1)
+    results = {}
+    dates = []
+    responses = fetch_world_series_schedules(years, max_workers)
+    for year, response in responses.items():
+        if response is None or response.status_code != 200:
             print(f"Failed to fetch data for {year}")
-            winners[year] = "Data not available"
+            results[year] = empty_result(year, DATA_NOT_AVAILABLE)
             continue
-        data = response.json()
-        dates = data.get("dates", [])
-        if not dates:
-            if year == end_year:
-                winners[year] = "No World Series yet"
-            else:
-                winners[year] = "No World Series"
-            continue
-        # Get the last game of the World Series
-        last_game = dates[-1]["games"][-1]
-        winner = last_game.get(
-            "teams", {}).get(
-                "away", {}).get(
-                    "team", {}).get(
-                        "name") if last_game.get(
-                            "teams", {}).get(
-                                "away", {}).get(
-                                    "isWinner") else last_game.get(
-                                        "teams", {}).get(
-                                            "home", {}).get(
-                                                "team", {}).get(
-                                                    "name")
-        winners[year] = winner
-    return winners
-
-def get_world_series_losers():
-    winners = get_world_series_winners()
-    losers = {}
-    for year, winner in winners.items():
-        if winner == "No World Series yet" or winner == "No World Series":
-            losers[year] = winner
-        else:
-            url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&season={year}&gameTypes=W"
-            response = requests.get(url)
-            data = response.json()
-            dates = data.get("dates", [])
-            if not dates:
-                losers[year] = "Data not available"
-                continue
-            last_game = dates[-1]["games"][-1]
-            loser = last_game.get(
-                "teams", {}).get(
-                    "away", {}).get(
-                        "team", {}).get(
-                            "name") if last_game.get(
-                                "teams", {}).get(
-                                    "away", {}).get(
-                                        "isWinner") else last_game.get(
-                                            "teams", {}).get(
-                                                "home", {}).get(
-                                                    "team", {}).get(
-                                                        "name")
-            losers[year] = loser
-    return losers
-
-
-world_series_winners = get_world_series_winners()
-world_series_losers = get_world_series_losers()
-
-# save the results to a csv file
-def save_to_csv(data, filename):
-    with open(filename, "w") as file:
-        file.write("Year,Team\n")
-        for year, team in data.items():
-            file.write(f"{year},{team}\n")
-
-save_to_csv(world_series_winners, "2WS/MLB_Champs.csv")
-save_to_csv(world_series_losers, "2WS/MLB_Losers.csv")
-print("Done")
+        schedule = schemas.decode(response.content, schemas.Schedule)
+        dates.extend(schedule.dates)
+        results[year] = parse_world_series(year, schedule, end_year)
+
+    # Keep the games and series in the local store as well
+    conn = store.connect()
+    store.insert_games(conn, dates)
+    store.insert_series(conn, [
+        (year, "World Series", r["Winner"], r["Loser"], r["Score"], r["Games"])
+        for year, r in results.items() if r["Games"]
+    ])
+    conn.close()
+    return results
+
+def parse_archived_world_series(params, body):
+    # Runs in a worker process during --replay
+    year = int(params["season"])
+    return year, parse_world_series(year, schemas.decode(body, schemas.Schedule), date.today().year)
+
+def replay_world_series(max_workers=None, end_year=date.today().year):
+    """
+    Re-parse the archived World Series schedules offline (see mlbapi/archive.py) and write them
+    over the stored seasons. Seasons that are not in the archive keep their stored rows.
+    """
+    replayed = dict(archive.replay(
+        parse_archived_world_series,
+        endpoint="schedule",
+        where={"sportId": 1, "gameTypes": "W"},
+        max_workers=max_workers,
+    ))
+    print(f"Replayed {len(replayed)} archived season(s)")
+    results = load_results(CHAMPS_PATH, LOSERS_PATH)
+    not_archived = [year for year in range(FIRST_WORLD_SERIES, end_year + 1) if year not in replayed]
+    missing = [year for year in not_archived if year not in results]
+    print(f"{len(not_archived) - len(missing)} season(s) not in the archive kept as stored")
+    if missing:
+        print(f"{len(missing)} season(s) neither archived nor stored (run without --replay to fetch them): {missing}")
+    if replayed:
+        results.update(replayed)
+        write_table(results, CHAMPS_PATH, "Winner")
+        write_table(results, LOSERS_PATH, "Loser")
+    return results
+
+def read_table(filename):
+    # Year -> row dict; a missing file just means nothing has been stored yet
+    if not os.path.exists(filename) and not os.path.exists(storage.parquet_path(filename)):
+        return {}
+    df = storage.read_table(filename, table="world_series")
+    return {int(row["Year"]): row for row in df.to_dict("records")}
+
+def load_results(champs_path=CHAMPS_PATH, losers_path=LOSERS_PATH):
+    champs = read_table(champs_path)
+    losers = read_table(losers_path)
+    results = {}
+    for year, row in champs.items():
+        results[year] = {
+            "Year": year,
+            "Winner": row["Team"],
+            "Loser": losers.get(year, {}).get("Team", ""),
+            "Score": row["Score"] if pd.notna(row.get("Score")) else "",
+            "Games": int(row["Games"]) if pd.notna(row.get("Games")) else 0,
+        }
+    return results
+
+def find_missing_years(results, end_year=date.today().year):
+    """
+    Seasons that still need to be fetched: not stored yet, marked as pending or failed,
+    or with a loser that is missing or equal to the winner (left over from older runs).
+    """
+    missing = []
+    for year in range(FIRST_WORLD_SERIES, end_year + 1):
+        result = results.get(year)
+        if result is None or result["Winner"] in (NO_WORLD_SERIES_YET, DATA_NOT_AVAILABLE):
+            missing.append(year)
+        elif result["Winner"] != NO_WORLD_SERIES and result["Loser"] in ("", result["Winner"]):
+            missing.append(year)
+    return missing
+
+# save the results as CSV (and typed Parquet when pyarrow is installed)
+def write_table(results, filename, team_column):
+    rows = [
+        {"Year": year, "Team": result[team_column], "Score": result["Score"], "Games": result["Games"]}
+        for year, result in sorted(results.items())
+    ]
+    storage.write_table(pd.DataFrame(rows, columns=["Year", "Team", "Score", "Games"]), filename, table="world_series")
+
+def update_world_series(full=False, end_year=date.today().year, max_workers=client.MAX_WORKERS):
+    results = {} if full else load_results(CHAMPS_PATH, LOSERS_PATH)
+    missing = find_missing_years(results, end_year)
+    print(f"Fetching {len(missing)} season(s): {missing[0]}-{missing[-1]}" if missing else "Everything is up to date")
+    if not missing:
+        return results
+    fetched = get_world_series_results(missing, end_year, max_workers)
+    # Keep what is already stored when a refetch fails
+    for year, result in fetched.items():
+        if result["Winner"] != DATA_NOT_AVAILABLE or year not in results:
+            results[year] = result
+    write_table(results, CHAMPS_PATH, "Winner")
+    write_table(results, LOSERS_PATH, "Loser")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update MLB_Champs.csv and MLB_Losers.csv")
+    parser.add_argument("--full", action="store_true", help="rebuild every season instead of only the missing ones")
+    parser.add_argument("--replay", action="store_true", help="rebuild from the raw response archive without fetching")
+    args = parser.parse_args()
+    if args.replay:
+        replay_world_series()
+    else:
+        update_world_series(full=args.full)
+    # Add the new seasons to MLB_Franchise_Stats.csv; a rebuild or replay may have changed old ones.
+    # A replay stays offline, so it only uses a franchise index that is already saved.
+    if args.replay and franchises.load_lineage(offline=True) is None:
+        print("No saved franchise index: franchise stats not updated (run python -m mlbapi.championships --rebuild)")
+    else:
+        try:
+            championships.update_stats(rebuild=args.full or args.replay)
+        except RuntimeError as e:
+            print(f"{e}: franchise stats not updated (run python -m mlbapi.championships --rebuild)")
+    print("Done")
@@ -0,0 +1,2 @@
+# Shared helpers for talking to the MLB Stats API (statsapi.mlb.com).
+# Scripts in the topic folders add the project root to sys.path and import from here.
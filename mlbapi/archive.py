@@ -0,0 +1,189 @@
+# Content-addressed archive of every raw Stats API response.
+# Bodies are compressed (zstd when the zstandard package is installed, gzip otherwise)
+# and stored once under objects/<hash[:2]>/<hash>, keyed by the SHA-256 of the body, so
+# refetching an unchanged response costs no extra space. An SQLite index records which
+# request produced which object and when.
+#
+# When parsing logic changes, replay() re-runs a parser over the archived responses on a
+# process pool, so outputs can be rebuilt offline instead of refetching everything:
+#
+#   python -m mlbapi.archive stats
+#   python -m mlbapi.archive replay-games      # rebuild the store's games table
+#   python "World Series/2Update_WS.py" --replay
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from mlbapi import cache, schemas, store
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_DIR = os.environ.get("MLB_STATSAPI_ARCHIVE_DIR", os.path.join(cache.ROOT_DIR, "archive", "statsapi"))
+ENABLED = os.environ.get("MLB_STATSAPI_ARCHIVE", "1") != "0"
+EXTENSION = ".zst" if zstandard is not None else ".gz"
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _connect():
+    global _conn
+    if _conn is None:
+        os.makedirs(ARCHIVE_DIR, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(ARCHIVE_DIR, "index.sqlite"), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                endpoint TEXT NOT NULL,
+                query TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (endpoint, query, sha256)
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _compress(body):
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def object_path(sha256, extension=EXTENSION):
+    return os.path.join(ARCHIVE_DIR, "objects", sha256[:2], sha256 + extension)
+
+
+def store_response(endpoint, params, body):
+    """
+    Archive one response body. Returns its SHA-256; identical bodies are stored once.
+    """
+    sha256 = hashlib.sha256(body).hexdigest()
+    path = object_path(sha256)
+    if not os.path.exists(path) and not os.path.exists(object_path(sha256, ".gz")):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(_compress(body))
+        os.replace(tmp_path, path)
+
+    query = json.dumps({k: str(v) for k, v in (params or {}).items()}, sort_keys=True)
+    with _lock:
+        conn = _connect()
+        conn.execute(
+            "INSERT INTO responses VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (endpoint, query, sha256) DO UPDATE SET fetched_at = excluded.fetched_at",
+            (endpoint, query, sha256, time.time()),
+        )
+        conn.commit()
+    return sha256
+
+
+def read_object(sha256):
+    path = object_path(sha256, ".zst")
+    if os.path.exists(path):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read .zst archive objects")
+        with open(path, "rb") as file:
+            return zstandard.ZstdDecompressor().decompress(file.read())
+    with open(object_path(sha256, ".gz"), "rb") as file:
+        return gzip.decompress(file.read())
+
+
+def latest_entries(endpoint=None, where=None):
+    """
+    (endpoint, params, sha256, fetched_at) of the most recent response for every archived
+    request, oldest first, optionally limited to one endpoint and to params matching every
+    key/value in `where`.
+    """
+    sql = "SELECT endpoint, query, sha256, MAX(fetched_at) FROM responses"
+    args = ()
+    if endpoint:
+        sql += " WHERE endpoint = ?"
+        args = (endpoint,)
+    sql += " GROUP BY endpoint, query ORDER BY MAX(fetched_at), endpoint, query"
+    with _lock:
+        rows = _connect().execute(sql, args).fetchall()
+    entries = []
+    for row_endpoint, query, sha256, fetched_at in rows:
+        params = json.loads(query)
+        if where and any(params.get(k) != str(v) for k, v in where.items()):
+            continue
+        entries.append((row_endpoint, params, sha256, fetched_at))
+    return entries
+
+
+def _replay_one(job):
+    parser, params, sha256 = job
+    return parser(params, read_object(sha256))
+
+
+def replay(parser, endpoint=None, where=None, max_workers=None):
+    """
+    Run parser(params, body) over the latest archived response of every matching request
+    on a process pool. `parser` must be a module-level function so it can be pickled.
+    Results come back in the order of latest_entries(), oldest response first.
+    """
+    jobs = [(parser, params, sha256) for _, params, sha256, _ in latest_entries(endpoint, where)]
+    if not jobs:
+        return []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_replay_one, jobs, chunksize=max(1, len(jobs) // 64)))
+
+
+def stats():
+    with _lock:
+        conn = _connect()
+        requests_count, objects_count = conn.execute(
+            "SELECT COUNT(DISTINCT endpoint || query), COUNT(DISTINCT sha256) FROM responses"
+        ).fetchone()
+    size = 0
+    for folder, _, files in os.walk(os.path.join(ARCHIVE_DIR, "objects")):
+        size += sum(os.path.getsize(os.path.join(folder, name)) for name in files)
+    return requests_count, objects_count, size
+
+
+def _schedule_game_rows(params, body):
+    # Replay parser: every game of an archived /schedule response as a store row
+    schedule = schemas.decode(body, schemas.Schedule)
+    return [store.game_row(game) for day in schedule.dates for game in day.games]
+
+
+def replay_games(max_workers=None):
+    """
+    Rebuild the store's games table from every archived /schedule response. Responses are
+    applied oldest first, so a game found in several queries keeps its newest state.
+    """
+    conn = store.connect()
+    count = 0
+    for rows in replay(_schedule_game_rows, endpoint="schedule", max_workers=max_workers):
+        with conn:
+            store.insert_game_rows(conn, rows)
+        count += len(rows)
+    conn.close()
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or replay the raw Stats API response archive")
+    parser.add_argument("command", choices=["stats", "replay-games"])
+    parser.add_argument("--workers", type=int, default=None, help="processes used for replay")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        requests_count, objects_count, size = stats()
+        print(f"{requests_count} requests, {objects_count} unique responses, {size / 1e6:.1f} MB on disk")
+    else:
+        print(f"Replayed {replay_games(args.workers)} games into {store.DB_PATH}")
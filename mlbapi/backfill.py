@@ -0,0 +1,129 @@
+# Backfill every MLB regular-season and postseason game into the local store.
+#
+#   python -m mlbapi.backfill                       # 1901 to the current season
+#   python -m mlbapi.backfill --start 1990 --end 1999 --window-days 15
+#
+# The range is split into shards (one date window of one season). Shards are fetched
+# concurrently and every finished shard is appended to a checkpoint journal, so after a
+# crash or a rate-limit stop the next run only fetches the shards that are not done.
+
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+
+import requests
+
+from mlbapi import cache, client, schemas, store
+
+JOURNAL_PATH = os.path.join(cache.CACHE_DIR, "backfill", "journal.jsonl")
+FIRST_SEASON = 1901
+GAME_TYPES = "R,F,D,L,W" # regular season, wild card, division series, LCS, World Series
+SEASON_START = (3, 1) # (month, day); no regular or postseason game falls outside these dates
+SEASON_END = (11, 30)
+WINDOW_DAYS = 30
+
+
+def season_shards(season, window_days=WINDOW_DAYS):
+    # Consecutive (start, end) ISO date windows covering one season
+    return client.date_windows(date(season, *SEASON_START), date(season, *SEASON_END), window_days)
+
+
+def shard_key(shard):
+    return f"{shard[0]}:{shard[1]}"
+
+
+class Journal:
+    """
+    Append-only checkpoint file with one JSON line per finished (or failed) shard.
+    The last line written for a shard wins.
+    """
+
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def done(self):
+        status = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue # a line cut short by a crash
+                    status[entry["shard"]] = entry["status"]
+        return {shard for shard, state in status.items() if state == "done"}
+
+    def write(self, shard, status, **details):
+        with self.lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(dict(shard=shard_key(shard), status=status, **details)) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+
+def fetch_shard(shard):
+    params = {"sportId": 1, "gameTypes": GAME_TYPES, "startDate": shard[0], "endDate": shard[1]}
+    # Skip the response cache: backfilled data goes straight into the store
+    response = client.get("schedule", params=params, use_cache=False)
+    response.raise_for_status()
+    return schemas.decode(response.content, schemas.Schedule).dates
+
+
+def backfill(start_season=FIRST_SEASON, end_season=None, window_days=WINDOW_DAYS,
+             max_workers=client.MAX_WORKERS, journal_path=JOURNAL_PATH):
+    """
+    Fetch every shard between two seasons that the journal does not mark as done and
+    insert its games into the store. Returns (shards done, shards failed, games stored).
+    """
+    end_season = end_season or date.today().year
+    journal = Journal(journal_path)
+    done = journal.done()
+    # The current season keeps changing, so its shards are always refetched
+    shards = [
+        shard
+        for season in range(start_season, end_season + 1)
+        for shard in season_shards(season, window_days)
+        if shard_key(shard) not in done or season == date.today().year
+    ]
+    print(f"{len(shards)} shard(s) to fetch, {len(done)} already done")
+
+    conn = store.connect()
+    finished = failed = stored = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch_shard, shard): shard for shard in shards}
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    dates = future.result()
+                except requests.RequestException as e:
+                    failed += 1
+                    journal.write(shard, "failed", error=str(e))
+                    print(f"Shard {shard_key(shard)} failed: {e}")
+                    continue
+                # Only this thread writes to SQLite, one transaction per shard
+                games = store.insert_games(conn, dates)
+                journal.write(shard, "done", games=games)
+                finished += 1
+                stored += games
+                if finished % 50 == 0:
+                    print(f"{finished}/{len(shards)} shards, {stored} games")
+    finally:
+        conn.close()
+    print(f"Done: {finished} shard(s), {stored} games stored, {failed} failed (rerun to retry them)")
+    return finished, failed, stored
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill all MLB regular-season and postseason games")
+    parser.add_argument("--start", type=int, default=FIRST_SEASON, help="first season")
+    parser.add_argument("--end", type=int, default=None, help="last season (default: current)")
+    parser.add_argument("--window-days", type=int, default=WINDOW_DAYS, help="days per shard")
+    parser.add_argument("--workers", type=int, default=client.MAX_WORKERS, help="concurrent requests")
+    parser.add_argument("--journal", default=JOURNAL_PATH, help="checkpoint journal path")
+    args = parser.parse_args()
+    backfill(args.start, args.end, args.window_days, args.workers, args.journal)
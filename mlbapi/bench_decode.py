@@ -0,0 +1,118 @@
+# Parse benchmark: dict-walking (json + nested .get/[] chains, as season.py used to do)
+# against typed decoding into schemas records.
+#
+#   python -m mlbapi.bench_decode                      # synthetic full season
+#   python -m mlbapi.bench_decode path/to/schedule.json # e.g. a recorded fixture body
+
+import argparse
+import json
+import random
+import time
+
+from mlbapi import schemas
+
+GAMES_PER_SEASON = 2430
+
+
+def synthetic_season(games=GAMES_PER_SEASON, seed=0):
+    # A /schedule payload shaped like the real one, including the fields we never read
+    rng = random.Random(seed)
+    dates = {}
+    for game_pk in range(games):
+        day = f"2025-{4 + game_pk // 450:02d}-{1 + game_pk % 450 // 15:02d}"
+        away_id, home_id = rng.sample(range(108, 159), 2)
+        away_score, home_score = rng.sample(range(0, 15), 2)
+        side = lambda team_id, score, won: {
+            "leagueRecord": {"wins": rng.randint(0, 100), "losses": rng.randint(0, 100), "pct": ".500"},
+            "score": score,
+            "team": {"id": team_id, "name": f"Team {team_id}", "link": f"/api/v1/teams/{team_id}"},
+            "isWinner": won,
+            "splitSquad": False,
+            "seriesNumber": rng.randint(1, 50),
+        }
+        dates.setdefault(day, []).append({
+            "gamePk": 770000 + game_pk,
+            "gameGuid": f"guid-{game_pk}",
+            "link": f"/api/v1.1/game/{770000 + game_pk}/feed/live",
+            "gameType": "R",
+            "season": "2025",
+            "gameDate": f"{day}T23:05:00Z",
+            "officialDate": day,
+            "status": {"abstractGameState": "Final", "codedGameState": "F", "detailedState": "Final", "statusCode": "F"},
+            "teams": {
+                "away": side(away_id, away_score, away_score > home_score),
+                "home": side(home_id, home_score, home_score > away_score),
+            },
+            "venue": {"id": rng.randint(1, 5000), "name": "Ballpark", "link": "/api/v1/venues/1"},
+            "content": {"link": f"/api/v1/game/{770000 + game_pk}/content"},
+            "dayNight": "night",
+            "scheduledInnings": 9,
+            "gamesInSeries": 3,
+            "seriesGameNumber": 1,
+            "seriesDescription": "Regular Season",
+        })
+    return json.dumps({"totalGames": games, "dates": [{"date": d, "games": g} for d, g in dates.items()]}).encode()
+
+
+def dict_walk(body):
+    # The original hand-written parsing: every team's (date, won, scored, allowed)
+    results = {}
+    data = json.loads(body)
+    for game in data.get("dates", []):
+        for matchup in game.get("games", []):
+            if matchup["status"]["detailedState"].lower() != "final":
+                continue
+            for side, other in (("away", "home"), ("home", "away")):
+                team_info = matchup["teams"][side]
+                results.setdefault(team_info["team"]["id"], []).append((
+                    matchup.get("officialDate", matchup.get("gameDate", game.get("date"))),
+                    team_info.get("isWinner", False),
+                    team_info["score"],
+                    matchup["teams"][other]["score"],
+                ))
+    return results
+
+
+def typed(body):
+    results = {}
+    for day in schemas.decode(body, schemas.Schedule).dates:
+        for game in day.games:
+            if game.status.detailedState.lower() != "final":
+                continue
+            for side, other in ((game.teams.away, game.teams.home), (game.teams.home, game.teams.away)):
+                results.setdefault(side.team.id, []).append(
+                    (game.officialDate, bool(side.isWinner), side.score, other.score)
+                )
+    return results
+
+
+def best_of(function, body, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(body)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare dict-walking and typed schedule parsing")
+    parser.add_argument("fixture", nargs="?", help="schedule JSON file (default: synthetic full season)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.fixture:
+        with open(args.fixture, "rb") as file:
+            body = file.read()
+        if body.startswith(b'{"endpoint"'):
+            body = json.loads(body)["body"].encode() # fixture saved by mlbapi/fixtures.py
+    else:
+        body = synthetic_season()
+
+    assert dict_walk(body) == typed(body), "parsers disagree"
+    baseline = best_of(dict_walk, body, args.repeat)
+    fast = best_of(typed, body, args.repeat)
+    decoder = "msgspec" if schemas.msgspec is not None else "json (msgspec not installed)"
+    print(f"Payload: {len(body) / 1e6:.1f} MB")
+    print(f"dict walking: {baseline * 1000:.1f} ms")
+    print(f"typed ({decoder}): {fast * 1000:.1f} ms  ({baseline / fast:.1f}x)")
@@ -0,0 +1,142 @@
+# Box score ingestion without one blocking request per game.
+#   1. One schedule request per date window with hydrate=linescore gives runs / hits /
+#      errors for every game, which is all Old Tests/statsapi/test1.ipynb printed.
+#   2. Player batting and pitching lines come from /game/{gamePk}/boxscore, fetched
+#      concurrently through the shared client. Final games are cached as immutable and
+#      games already in the store are skipped.
+#   3. Everything is written to the SQLite store in bulk.
+#
+#   python -m mlbapi.boxscores --start 2025-04-01 --end 2025-04-30
+#   python -m mlbapi.boxscores --start 2025-04-01 --end 2025-04-30 --linescores-only
+
+import argparse
+
+from mlbapi import client, schemas, store
+
+GAME_TYPES = "R,F,D,L,W"
+WINDOW_DAYS = 31
+FINAL_STATES = ("final", "game over", "completed early")
+
+
+def fetch_games(start_date, end_date, game_types=GAME_TYPES):
+    # Schedule with linescores, one request per window, fetched in parallel
+    params_list = [
+        {"sportId": 1, "gameTypes": game_types, "startDate": start, "endDate": end, "hydrate": "linescore"}
+        for start, end in client.date_windows(start_date, end_date, WINDOW_DAYS)
+    ]
+    dates = []
+    for response in client.get_many("schedule", params_list):
+        if response is None or response.status_code != 200:
+            print("Failed to fetch schedule data")
+            return None
+        dates.extend(schemas.decode(response.content, schemas.Schedule).dates)
+    return dates
+
+
+def linescore_rows(game):
+    if game.linescore is None:
+        return []
+    rows = []
+    for side in ("away", "home"):
+        line = getattr(game.linescore.teams, side)
+        team_id = getattr(game.teams, side).team.id
+        rows.append((game.gamePk, team_id, side, line.runs, line.hits, line.errors, line.leftOnBase))
+    return rows
+
+
+def player_rows(game_pk, boxscore):
+    """
+    Normalize one box score into (batting rows, pitching rows) for the store.
+    """
+    batting = []
+    pitching = []
+    for side in ("away", "home"):
+        team = getattr(boxscore.teams, side)
+        for player_id in team.batters:
+            player = team.players.get(f"ID{player_id}")
+            if player is None:
+                continue
+            stats = player.stats.batting
+            batting.append((
+                game_pk, team.team.id, player_id, player.person.fullName,
+                int(player.battingOrder) if player.battingOrder.isdigit() else None,
+                stats.atBats, stats.runs, stats.hits, stats.doubles, stats.triples,
+                stats.homeRuns, stats.rbi, stats.baseOnBalls, stats.strikeOuts, stats.stolenBases,
+            ))
+        for player_id in team.pitchers:
+            player = team.players.get(f"ID{player_id}")
+            if player is None:
+                continue
+            stats = player.stats.pitching
+            pitching.append((
+                game_pk, team.team.id, player_id, player.person.fullName,
+                stats.inningsPitched, stats.outs, stats.hits, stats.runs, stats.earnedRuns,
+                stats.baseOnBalls, stats.strikeOuts, stats.homeRuns, stats.numberOfPitches,
+            ))
+    return batting, pitching
+
+
+def stored_boxscores(conn, game_pks):
+    # Games whose player lines are already in the store
+    found = set()
+    game_pks = list(game_pks)
+    for i in range(0, len(game_pks), 500):
+        chunk = game_pks[i:i + 500]
+        marks = ", ".join("?" * len(chunk))
+        found.update(row[0] for row in conn.execute(
+            f"SELECT DISTINCT game_pk FROM pitching_lines WHERE game_pk IN ({marks})", chunk
+        ))
+    return found
+
+
+def ingest_boxscores(start_date, end_date, players=True, batch_size=200, max_workers=client.MAX_WORKERS):
+    """
+    Load games, linescores and (unless players=False) batting and pitching lines between two dates.
+    Returns (games, box scores fetched).
+    """
+    dates = fetch_games(start_date, end_date)
+    if dates is None:
+        return 0, 0
+    games = [game for day in dates for game in day.games]
+    final = [game for game in games if game.status.detailedState.lower() in FINAL_STATES]
+
+    conn = store.connect()
+    store.insert_games(conn, dates)
+    store.insert_rows(conn, "linescores", [row for game in games for row in linescore_rows(game)])
+
+    fetched = 0
+    if players:
+        todo = sorted({game.gamePk for game in final} - stored_boxscores(conn, (game.gamePk for game in final)))
+        print(f"{len(final)} final games, {len(todo)} box score(s) to fetch")
+        # Fetch in batches so rows are written as we go and memory stays bounded
+        for i in range(0, len(todo), batch_size):
+            batch = todo[i:i + batch_size]
+            responses = client.get_each(
+                [(f"game/{game_pk}/boxscore", None) for game_pk in batch],
+                max_workers=max_workers,
+                immutable=True,
+            )
+            batting = []
+            pitching = []
+            for game_pk, response in zip(batch, responses):
+                if response is None or response.status_code != 200:
+                    continue
+                rows = player_rows(game_pk, schemas.decode(response.content, schemas.Boxscore))
+                batting += rows[0]
+                pitching += rows[1]
+                fetched += 1
+            store.insert_rows(conn, "batting_lines", batting)
+            store.insert_rows(conn, "pitching_lines", pitching)
+    conn.close()
+    print(f"Stored {len(games)} games and {fetched} box score(s)")
+    return len(games), fetched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load linescores and box scores into the local store")
+    parser.add_argument("--start", required=True, help="first date (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="last date (YYYY-MM-DD)")
+    parser.add_argument("--linescores-only", action="store_true", help="skip per-game box score requests")
+    parser.add_argument("--workers", type=int, default=client.MAX_WORKERS, help="concurrent box score requests")
+    args = parser.parse_args()
+    ingest_boxscores(args.start, args.end, players=not args.linescores_only, max_workers=args.workers)
@@ -0,0 +1,189 @@
+# Disk-backed response cache for the Stats API.
+# Entries live in a single SQLite file keyed by URL + query string.
+#   - Responses for past seasons never change, so they are kept forever.
+#   - Current-season responses expire after CURRENT_TTL seconds and are then
+#     revalidated with ETag / If-Modified-Since instead of downloaded again.
+#   - The total size is bounded; least recently used entries are evicted first.
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import date
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.environ.get("MLB_STATSAPI_CACHE_DIR", os.path.join(ROOT_DIR, ".cache", "statsapi"))
+ENABLED = os.environ.get("MLB_STATSAPI_CACHE", "1") != "0"
+CURRENT_TTL = int(os.environ.get("MLB_STATSAPI_CACHE_TTL", 15 * 60)) # seconds before current-season data is revalidated
+MAX_BYTES = int(os.environ.get("MLB_STATSAPI_CACHE_MAX_MB", 256)) * 1024 * 1024
+
+# Query parameters that pin a request to a point in time
+SEASON_PARAMS = ("season", "seasons")
+DATE_PARAMS = ("endDate", "date", "startDate")
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _connect():
+    global _conn
+    if _conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(os.path.join(CACHE_DIR, "responses.sqlite"), check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                immutable INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access)")
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def cache_key(url, params=None):
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+
+def is_immutable(params=None, current_year=None):
+    """
+    A request is immutable when every season or date it asks for is before the current year.
+    """
+    if not params:
+        return False
+    current_year = current_year or date.today().year
+    years = []
+    for name in SEASON_PARAMS:
+        if name in params:
+            years += [int(s) for s in str(params[name]).split(",") if s.strip().isdigit()]
+    for name in DATE_PARAMS:
+        if name in params and params[name]:
+            years.append(int(str(params[name])[:4]))
+    return bool(years) and max(years) < current_year
+
+
+def _to_response(url, body, headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    response.encoding = "utf-8"
+    response.headers = CaseInsensitiveDict(headers or {"Content-Type": "application/json"})
+    response.from_cache = True
+    return response
+
+
+def lookup(key):
+    with _lock:
+        row = _connect().execute(
+            "SELECT url, body, etag, last_modified, immutable, fetched_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+    if row is None:
+        return None
+    url, body, etag, last_modified, immutable, fetched_at = row
+    return {
+        "url": url,
+        "body": zlib.decompress(body),
+        "etag": etag,
+        "last_modified": last_modified,
+        "immutable": bool(immutable),
+        "fetched_at": fetched_at,
+    }
+
+
+def store(key, url, body, etag=None, last_modified=None, immutable=False):
+    now = time.time()
+    blob = zlib.compress(body)
+    with _lock:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, blob, len(blob), etag, last_modified, int(immutable), now, now),
+        )
+        conn.commit()
+        _evict(conn)
+
+
+def touch(key, revalidated=False):
+    now = time.time()
+    with _lock:
+        conn = _connect()
+        if revalidated:
+            conn.execute("UPDATE responses SET last_access = ?, fetched_at = ? WHERE key = ?", (now, now, key))
+        else:
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        conn.commit()
+
+
+def _evict(conn):
+    # Drop least recently used entries until the cache fits in MAX_BYTES
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    if total <= MAX_BYTES:
+        return
+    for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall():
+        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        total -= size
+        if total <= MAX_BYTES:
+            break
+    conn.commit()
+
+
+def clear():
+    with _lock:
+        conn = _connect()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+
+
+def cached_get(fetch, url, params=None, timeout=None, immutable=None):
+    """
+    GET through the cache, calling fetch(url, params=, timeout=, headers=) on a miss.
+    Returns a requests.Response; cache hits carry `from_cache = True`.
+    Pass immutable=True/False to override the season-based rule (e.g. for final game feeds).
+    """
+    key = cache_key(url, params)
+    if immutable is None:
+        immutable = is_immutable(params)
+    entry = lookup(key)
+
+    if entry is not None and (entry["immutable"] or time.time() - entry["fetched_at"] < CURRENT_TTL):
+        touch(key)
+        return _to_response(entry["url"], entry["body"])
+
+    headers = {}
+    if entry is not None:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = fetch(url, params=params, timeout=timeout, headers=headers)
+    if response.status_code == 304 and entry is not None:
+        touch(key, revalidated=True)
+        return _to_response(entry["url"], entry["body"])
+    if response.status_code == 200:
+        store(
+            key,
+            response.url,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            immutable=immutable,
+        )
+    response.from_cache = False
+    return response
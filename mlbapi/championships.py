@@ -0,0 +1,199 @@
+# Materialized World Series statistics per franchise.
+# Champions and losers are resolved to franchises with the year-aware lineage index, counted
+# with vectorized group-bys, and stored as World Series/MLB_Franchise_Stats.csv (plus Parquet).
+# The table remembers the last season it covers ("Through"), so after 2Update_WS.py appends a
+# season only the new rows are aggregated and added to the stored counts. "Through" never
+# moves past a season with a team the lineage cannot resolve, so no appearance is skipped.
+# Columns that depend on today's date (Years Since Last Championship, Championships per Year
+# Active) are recomputed from the stored counts every time the table is loaded.
+#
+#   python -m mlbapi.championships            # update with any new seasons
+#   python -m mlbapi.championships --rebuild  # recompute everything from the CSVs
+
+import argparse
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from mlbapi import cache, franchises, storage, teams
+
+WORLD_SERIES_DIR = os.path.join(cache.ROOT_DIR, "World Series")
+CHAMPS_PATH = os.path.join(WORLD_SERIES_DIR, "MLB_Champs.csv")
+LOSERS_PATH = os.path.join(WORLD_SERIES_DIR, "MLB_Losers.csv")
+STATS_PATH = os.path.join(WORLD_SERIES_DIR, "MLB_Franchise_Stats.csv")
+
+# Markers written by World Series/2Update_WS.py instead of a team name
+NO_WORLD_SERIES = "No World Series"
+PENDING = ("No World Series yet", "Data not available")
+
+DISPLAY_COLUMNS = [
+    "Team", "Wins", "Losses", "Appearances", "Win %",
+    "Years Since Last Championship", "Championships per Year Active", "Seasons",
+]
+COUNT_COLUMNS = ["Wins", "Losses", "Appearances"]
+
+
+def world_series_events(champs, losers):
+    """
+    One row per World Series appearance (Year, Team, Won) for every season known to be final,
+    and the last season up to which all results are final. A season is not final while it is
+    pending or its loser is missing (or still equal to the winner, as in old loser files).
+    """
+    merged = champs[["Year", "Team"]].merge(
+        losers[["Year", "Team"]], on="Year", how="left", suffixes=("", " Loser")
+    ).sort_values("Year")
+    played = ~merged["Team"].isin((NO_WORLD_SERIES,) + PENDING)
+    unknown_loser = merged["Team Loser"].isna() | (merged["Team Loser"] == merged["Team"])
+    pending = merged["Team"].isin(PENDING) | (played & unknown_loser)
+    through = int(merged["Year"][pending].min() - 1) if pending.any() else int(merged["Year"].max())
+
+    final = merged[played & (merged["Year"] <= through)]
+    events = pd.concat([
+        pd.DataFrame({"Year": final["Year"], "Team": final["Team"], "Won": True}),
+        pd.DataFrame({"Year": final["Year"], "Team": final["Team Loser"], "Won": False}),
+    ], ignore_index=True)
+    return events, through
+
+
+def resolved_through(events, through, lineage):
+    """
+    Cap `through` before the first season with an appearance whose team does not resolve to
+    a franchise, so those appearances are counted once the lineage knows the team.
+    """
+    ids = lineage.resolve_ids(events["Team"], events["Year"])
+    unknown = events[ids.isna()]
+    if unknown.empty:
+        return through
+    first = int(unknown["Year"].min())
+    print(f"Unknown team(s) from {first} on: {', '.join(map(str, unknown['Team'].unique()))}")
+    return min(through, first - 1)
+
+
+def aggregate(events, lineage):
+    """
+    Per-franchise counts for a set of appearances, indexed by franchise ID.
+    Every team in `events` must resolve to a franchise (see resolved_through).
+    """
+    ids = lineage.resolve_ids(events["Team"], events["Year"])
+    if ids.isna().any():
+        raise ValueError("World Series appearances of teams missing from the franchise lineage")
+    events = events.assign(franchise_id=ids).sort_values("Year")
+
+    year = events["Year"].astype(int).astype(str)
+    events = events.assign(Season=year.where(~events["Won"], "**" + year + "**")) # winning seasons in bold
+    grouped = events.groupby("franchise_id")
+    appearances = grouped.size()
+    wins = grouped["Won"].sum()
+    return pd.DataFrame({
+        "Wins": wins,
+        "Losses": appearances - wins,
+        "Appearances": appearances,
+        "Last Championship": events[events["Won"]].groupby("franchise_id")["Year"].max(),
+        "Seasons": grouped["Season"].agg(", ".join),
+    })
+
+
+def empty_table(lineage, teams_info_path=teams.TEAMS_INFO_PATH):
+    # Every current club with no appearances yet, and the season each one started play
+    info = storage.read_table(teams_info_path, columns=["id", "name", "firstYearOfPlay"], table="teams_info")
+    table = pd.DataFrame({
+        "Team": info["name"].values,
+        "First Year": info["firstYearOfPlay"].values,
+    }, index=pd.Index(info["id"].astype("Int64"), name="franchise_id"))
+    for column in COUNT_COLUMNS:
+        table[column] = 0
+    table["Last Championship"] = np.nan
+    table["Seasons"] = ""
+    return table
+
+
+def add_counts(table, counts, lineage):
+    """
+    Add the counts of newly aggregated appearances to the stored table.
+    """
+    table = table.reindex(table.index.union(counts.index))
+    counts = counts.reindex(table.index)
+    table[COUNT_COLUMNS] = table[COUNT_COLUMNS].fillna(0).add(counts[COUNT_COLUMNS].fillna(0)).astype(int)
+    table["Last Championship"] = np.fmax(
+        table["Last Championship"].astype(float), counts["Last Championship"].astype(float)
+    )
+    old = table["Seasons"].fillna("")
+    new = counts["Seasons"].fillna("")
+    table["Seasons"] = old + np.where((old != "") & (new != ""), ", ", "") + new
+    # Franchises that are no longer in MLB_Teams_Info.csv keep their lineage name
+    table["Team"] = table["Team"].fillna(pd.Series(table.index.map(lineage.names), index=table.index))
+    return table
+
+
+def finalize(table, current_year=None):
+    """
+    Recompute the derived columns from the stored counts and sort by championships.
+    """
+    current_year = current_year or date.today().year
+    appearances = table["Appearances"].replace(0, np.nan)
+    years_active = current_year - table["First Year"].astype(float) + 1
+    table["Win %"] = (table["Wins"] / appearances).round(3)
+    table["Years Since Last Championship"] = (current_year - table["Last Championship"]).astype("Int64")
+    table["Championships per Year Active"] = (table["Wins"] / years_active).round(4)
+    return table.sort_values(["Wins", "Appearances", "Team"], ascending=[False, False, True])
+
+
+def load_stats(path=STATS_PATH, current_year=None):
+    table = storage.read_table(path, table="franchise_stats").set_index("franchise_id")
+    table["Seasons"] = table["Seasons"].fillna("")
+    return finalize(table, current_year)
+
+
+def save_stats(table, path=STATS_PATH):
+    storage.write_table(table.reset_index(), path, table="franchise_stats")
+
+
+def update_stats(rebuild=False, path=STATS_PATH, champs_path=CHAMPS_PATH, losers_path=LOSERS_PATH,
+                 teams_info_path=teams.TEAMS_INFO_PATH, current_year=None):
+    """
+    Bring the stored franchise table up to date and return it. Only seasons after the stored
+    "Through" season are aggregated unless rebuild=True or nothing is stored yet.
+    """
+    champs = storage.read_table(champs_path, columns=["Year", "Team"], table="world_series")
+    losers = storage.read_table(losers_path, columns=["Year", "Team"], table="world_series")
+    events, through = world_series_events(champs, losers)
+
+    exists = os.path.exists(path) or os.path.exists(storage.parquet_path(path))
+    stored = not rebuild and exists
+    if stored:
+        table = load_stats(path, current_year)
+        done = int(table["Through"].max())
+        if done >= through:
+            return table
+        events = events[events["Year"] > done]
+
+    lineage = franchises.load_lineage()
+    resolved = resolved_through(events, through, lineage)
+    if resolved < through:
+        events = events[events["Year"] <= resolved]
+        if events.empty:
+            # Nothing new can be counted; keep the stored table instead of saving empty counts
+            if not exists:
+                raise RuntimeError("No World Series appearance could be resolved to a franchise")
+            print(f"Franchise stats not updated past {resolved}")
+            return table if stored else load_stats(path, current_year)
+        through = resolved
+    if not stored:
+        table = empty_table(lineage, teams_info_path)
+
+    table = add_counts(table, aggregate(events, lineage), lineage)
+    table["Through"] = through
+    table = finalize(table, current_year)
+    save_stats(table, path)
+    print(f"Franchise stats updated through {through} ({len(events)} new appearance(s))")
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Update the materialized World Series franchise table")
+    parser.add_argument("--rebuild", action="store_true", help="recompute from the champions and losers tables")
+    args = parser.parse_args()
+    table = update_stats(rebuild=args.rebuild)
+    print(table[DISPLAY_COLUMNS].to_string(index=False))
@@ -0,0 +1,152 @@
+# One pooled, keep-alive HTTP session shared by every Stats API fetch script.
+# Opening a new TCP + TLS connection per request is what made the historical
+# refreshes slow; reusing a Session pays that handshake once per host.
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mlbapi import archive, cache, fixtures, scheduler
+
+BASE_URL = os.environ.get("MLB_STATSAPI_BASE_URL", "https://statsapi.mlb.com/api/v1")
+POOL_SIZE = int(os.environ.get("MLB_STATSAPI_POOL_SIZE", 16)) # max open connections kept alive
+MAX_WORKERS = int(os.environ.get("MLB_STATSAPI_MAX_WORKERS", 8)) # concurrent requests in get_many
+RETRY_PASSES = 1 # extra sweeps over requests that still failed after the scheduler's retries
+TIMEOUT = (5, 30) # (connect, read) seconds
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_size=POOL_SIZE):
+    """
+    Return the shared requests.Session, creating it on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            return _session
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        _session = session
+        return _session
+
+
+def build_url(path):
+    # Accept either a full URL or an endpoint path such as "schedule" or "/teams"
+    if path.startswith("http://") or path.startswith("https://"):
+        return path
+    return f"{BASE_URL.rstrip('/')}/{path.lstrip('/')}"
+
+
+def send(url, params=None, timeout=TIMEOUT, headers=None):
+    # Every request that reaches the network goes through the rate limiter and retry policy
+    return scheduler.send(lambda: get_session().get(url, params=params, timeout=timeout, headers=headers))
+
+
+def get(path, params=None, timeout=TIMEOUT, use_cache=True, immutable=None):
+    """
+    GET a Stats API endpoint through the shared session and return the Response.
+    Responses go through the on-disk cache (mlbapi/cache.py) unless use_cache is False.
+    """
+    url = build_url(path)
+    if use_cache and cache.ENABLED:
+        response = cache.cached_get(send, url, params=params, timeout=timeout, immutable=immutable)
+    else:
+        response = send(url, params=params, timeout=timeout)
+    if fixtures.RECORD:
+        fixtures.record(path, params, response)
+    if archive.ENABLED and response.status_code == 200 and not getattr(response, "from_cache", False):
+        archive.store_response(fixtures.endpoint_of(path), params, response.content)
+    return response
+
+
+def get_json(path, params=None, timeout=TIMEOUT, use_cache=True, immutable=None):
+    """
+    GET a Stats API endpoint and return the decoded JSON, or None if the request failed.
+    """
+    try:
+        response = get(path, params=params, timeout=timeout, use_cache=use_cache, immutable=immutable)
+    except requests.RequestException as e:
+        print(f"Request to {path} failed: {e}")
+        return None
+    if response.status_code != 200:
+        print(f"Request to {path} returned status {response.status_code}")
+        return None
+    return response.json()
+
+
+def get_many(path, params_list, max_workers=MAX_WORKERS, **kwargs):
+    """
+    GET the same endpoint once per parameter set, at most max_workers requests at a time.
+    Responses are returned in the same order as params_list. Requests that still fail are
+    retried in another sweep; any that never succeed yield None (or their error response).
+    """
+    return get_each([(path, params) for params in params_list], max_workers=max_workers, **kwargs)
+
+
+def get_each(requests_list, max_workers=MAX_WORKERS, **kwargs):
+    """
+    Like get_many, but for a list of (path, params) pairs that may hit different endpoints.
+    """
+    def fetch(request):
+        path, params = request
+        try:
+            return get(path, params=params, **kwargs)
+        except requests.RequestException as e:
+            print(f"Request to {path} {params} failed: {e}")
+            return None
+
+    def failed(response):
+        return response is None or response.status_code in scheduler.RETRY_STATUSES
+
+    requests_list = list(requests_list)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        responses = list(executor.map(fetch, requests_list))
+        for _ in range(RETRY_PASSES):
+            retry = [i for i, response in enumerate(responses) if failed(response)]
+            if not retry:
+                break
+            print(f"Retrying {len(retry)} failed request(s)")
+            for i, response in zip(retry, executor.map(fetch, [requests_list[i] for i in retry])):
+                responses[i] = response
+
+    still_failed = sum(failed(response) for response in responses)
+    if still_failed:
+        print(f"{still_failed} request(s) failed after retries")
+    return responses
+
+
+def _as_date(value):
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, date) and not hasattr(value, "hour"):
+        return value
+    return value.date() # datetime or pandas Timestamp
+
+
+def date_windows(start_date, end_date, window_days):
+    """
+    Split [start_date, end_date] into consecutive, non-overlapping (start, end) ISO date
+    windows of at most window_days days, e.g. to fetch a long schedule range with get_many.
+    The bounds may be ISO strings, dates or pandas Timestamps.
+    """
+    start = _as_date(start_date)
+    end = _as_date(end_date)
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days - 1), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + timedelta(days=1)
+    return windows
@@ -0,0 +1,60 @@
+# Recorded Stats API responses used by the offline stand-in server (mlbapi/replay_server.py).
+# Set MLB_STATSAPI_RECORD=1 while running any fetch script to capture every response
+# it receives; each request is saved once as <hash>.json under FIXTURES_DIR.
+
+import hashlib
+import json
+import os
+from urllib.parse import urlsplit
+
+from mlbapi import cache
+
+FIXTURES_DIR = os.environ.get("MLB_STATSAPI_FIXTURES_DIR", os.path.join(cache.ROOT_DIR, "fixtures", "statsapi"))
+RECORD = os.environ.get("MLB_STATSAPI_RECORD", "0") == "1"
+API_PREFIX = "/api/v1/"
+
+
+def endpoint_of(path):
+    # "schedule", "/schedule" and "https://statsapi.mlb.com/api/v1/schedule" all become "schedule"
+    path = urlsplit(path).path
+    if API_PREFIX in path:
+        path = path.split(API_PREFIX, 1)[1]
+    return path.strip("/")
+
+
+def fixture_key(path, params=None):
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return hashlib.sha256(f"{endpoint_of(path)}?{query}".encode("utf-8")).hexdigest()
+
+
+def fixture_path(path, params=None):
+    return os.path.join(FIXTURES_DIR, f"{fixture_key(path, params)}.json")
+
+
+def save(path, params, status, body):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    fixture = {
+        "endpoint": endpoint_of(path),
+        "params": {k: str(v) for k, v in (params or {}).items()},
+        "status": status,
+        "body": body.decode("utf-8") if isinstance(body, bytes) else body,
+    }
+    with open(fixture_path(path, params), "w", encoding="utf-8") as file:
+        json.dump(fixture, file)
+
+
+def record(path, params, response):
+    # Only successful responses are worth replaying
+    if response is not None and response.status_code == 200:
+        save(path, params, response.status_code, response.content)
+
+
+def load(path, params=None):
+    """
+    Return the recorded fixture for a request, or None if it was never captured.
+    """
+    filename = fixture_path(path, params)
+    if not os.path.exists(filename):
+        return None
+    with open(filename, encoding="utf-8") as file:
+        return json.load(file)
@@ -0,0 +1,170 @@
+# Year-aware franchise lineage: (team name, season) -> franchise.
+# A Stats API team ID stays with a franchise through moves and renames (the 1901 Milwaukee
+# Brewers, the St. Louis Browns and the Baltimore Orioles are all team 110), so one
+# /teams?season= snapshot per season is enough to tell which franchise a name meant in a
+# given year. The snapshots are kept in CACHE_DIR/franchise_index.json, so past seasons are
+# fetched once; only the seasons that were still current when the index was written are
+# refetched after MAX_AGE. The spans are expanded in memory into a (name, season) dictionary
+# for O(1) lookups.
+
+import json
+import os
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from mlbapi import cache, client, schemas
+
+INDEX_PATH = os.path.join(cache.CACHE_DIR, "franchise_index.json")
+FIRST_SEASON = 1901
+MAX_AGE = 7 * 24 * 60 * 60 # seconds before the saved current-season snapshot is refetched
+
+_lineage = None
+
+
+def normalize(name):
+    return " ".join(str(name).lower().split())
+
+
+def fetch_snapshots(seasons):
+    """
+    {season: [(team ID, name), ...]} for every MLB club of every season given.
+    Seasons whose request failed are left out. Past seasons never change, so their responses
+    stay in the HTTP cache for good.
+    """
+    seasons = list(seasons)
+    params_list = [{"sportId": 1, "season": season} for season in seasons]
+    snapshots = {}
+    for season, response in zip(seasons, client.get_many("teams", params_list)):
+        if response is None or response.status_code != 200:
+            print(f"Failed to fetch teams for {season}")
+            continue
+        teams = schemas.decode(response.content, schemas.Teams).teams
+        snapshots[season] = [(team.id, team.name) for team in teams]
+    return snapshots
+
+
+def build_spans(snapshots):
+    """
+    Collapse season snapshots into {name: [[first season, last season, team ID], ...]}
+    and {team ID: latest name}.
+    """
+    spans = {}
+    names = {}
+    for season in sorted(snapshots):
+        for team_id, name in snapshots[season]:
+            names[team_id] = name
+            runs = spans.setdefault(normalize(name), [])
+            if runs and runs[-1][2] == team_id and runs[-1][1] == season - 1:
+                runs[-1][1] = season
+            else:
+                runs.append([season, season, team_id])
+    return spans, names
+
+
+class Lineage:
+    """
+    Resolve team names as they were written in a given season to franchises.
+    A franchise is identified by its team ID and labelled with its current name.
+    """
+
+    def __init__(self, spans, names):
+        self.spans = spans
+        self.names = {int(team_id): name for team_id, name in names.items()}
+        self.lookup = {}
+        for name, runs in spans.items():
+            for first, last, team_id in runs:
+                for season in range(first, last + 1):
+                    self.lookup[(name, season)] = team_id
+        # Names only ever used by one franchise also resolve outside their recorded seasons
+        self.by_name = {
+            name: runs[0][2] for name, runs in spans.items() if len({run[2] for run in runs}) == 1
+        }
+        self._keys = pd.MultiIndex.from_tuples(list(self.lookup), names=["name", "season"])
+        self._ids = np.array(list(self.lookup.values()), dtype=np.int64)
+
+    def franchise_id(self, name, season):
+        name = normalize(name)
+        team_id = self.lookup.get((name, int(season)))
+        if team_id is None:
+            team_id = self.by_name.get(name)
+        return team_id
+
+    def franchise(self, name, season):
+        """
+        Current name of the franchise `name` referred to in `season`, or None if unknown.
+        """
+        team_id = self.franchise_id(name, season)
+        return self.names.get(team_id)
+
+    def resolve_ids(self, names, seasons):
+        """
+        Franchise IDs for two aligned columns of names and seasons (nullable Int64; <NA> if unknown).
+        """
+        names = pd.Series(names).astype(str).str.lower().str.split().str.join(" ")
+        seasons = pd.Series(seasons).astype(int)
+        positions = self._keys.get_indexer(pd.MultiIndex.from_arrays([names.values, seasons.values]))
+        found = positions >= 0
+        ids = pd.Series(-1, index=names.index, dtype=np.int64)
+        ids[found] = self._ids[positions[found]]
+        # Fall back to the season-independent lookup for names outside their recorded spans
+        missing = ~found
+        ids[missing] = names[missing].map(self.by_name).fillna(-1).astype(np.int64)
+        return ids.where(ids >= 0).astype("Int64")
+
+    def resolve(self, names, seasons):
+        """
+        Franchise names for two aligned columns; unknown names are returned unchanged.
+        """
+        names = pd.Series(names)
+        labels = self.resolve_ids(names, seasons).map(self.names)
+        return labels.where(labels.notna(), names)
+
+
+def save_index(snapshots, path=INDEX_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"snapshots": snapshots}, file)
+
+
+def read_index(path=INDEX_PATH):
+    # Saved snapshots; an index in the older spans-only format has none and is rebuilt
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return {int(season): [tuple(team) for team in teams] for season, teams in data.get("snapshots", {}).items()}
+
+
+def load_lineage(refresh=False, offline=False):
+    """
+    Return the shared Lineage. Past seasons come from the saved index; seasons that are
+    missing, or were still current when an index older than MAX_AGE was written, are fetched
+    (every season with refresh=True). With offline=True nothing is fetched, and None is
+    returned when no index is saved.
+    """
+    global _lineage
+    if _lineage is not None and not refresh:
+        return _lineage
+
+    snapshots = {} if refresh else read_index()
+    if offline:
+        _lineage = Lineage(*build_spans(snapshots)) if snapshots else None
+        return _lineage
+
+    if snapshots and time.time() - os.path.getmtime(INDEX_PATH) >= MAX_AGE:
+        saved_season = date.fromtimestamp(os.path.getmtime(INDEX_PATH)).year
+        snapshots = {season: teams for season, teams in snapshots.items() if season < saved_season}
+    missing = [season for season in range(FIRST_SEASON, date.today().year + 1) if season not in snapshots]
+    if missing:
+        fetched = fetch_snapshots(missing)
+        snapshots.update(fetched)
+        # Only a complete index is saved; a partial one is used for this run only
+        if len(fetched) == len(missing):
+            save_index(dict(sorted(snapshots.items())))
+        else:
+            print(f"Teams missing for {len(missing) - len(fetched)} season(s); franchise index not saved")
+    _lineage = Lineage(*build_spans(snapshots))
+    return _lineage
@@ -0,0 +1,132 @@
+# Compact, column-oriented log of completed games.
+# Each column is a preallocated NumPy array (dates as int32 days since 1970-01-01,
+# team IDs as int16, scores as int8) that grows in place by doubling, so a full
+# history of ~300,000 games takes a few MB instead of hundreds of MB of tuples.
+# to_pandas() wraps the columns without copying them.
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = {
+    "game_pk": np.int32,
+    "date": np.int32, # days since 1970-01-01
+    "season": np.int16,
+    "game_type": "S1", # R, F, D, L, W, ...
+    "away_id": np.int16,
+    "home_id": np.int16,
+    "away_score": np.int8,
+    "home_score": np.int8,
+}
+INITIAL_CAPACITY = 4096
+EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def to_days(iso_date):
+    return int((np.datetime64(iso_date, "D") - EPOCH).astype(np.int32))
+
+
+class GameLog:
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        self.size = 0
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.team_names = {} # team ID -> latest name seen
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def capacity(self):
+        return len(self.columns["game_pk"])
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def reserve(self, capacity):
+        # Grow every column to at least `capacity` rows, keeping what is stored
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, self.capacity * 2)
+        for name, column in self.columns.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+
+    def append(self, game):
+        """
+        Append one completed schemas.Game record.
+        """
+        self.reserve(self.size + 1)
+        i = self.size
+        away = game.teams.away
+        home = game.teams.home
+        self.columns["game_pk"][i] = game.gamePk
+        self.columns["date"][i] = to_days(game.officialDate)
+        self.columns["season"][i] = int(game.season or game.officialDate[:4])
+        self.columns["game_type"][i] = game.gameType.encode()[:1]
+        self.columns["away_id"][i] = away.team.id
+        self.columns["home_id"][i] = home.team.id
+        self.columns["away_score"][i] = away.score or 0
+        self.columns["home_score"][i] = home.score or 0
+        self.team_names[away.team.id] = away.team.name
+        self.team_names[home.team.id] = home.team.name
+        self.size += 1
+
+    def extend(self, games):
+        for game in games:
+            self.append(game)
+
+    @classmethod
+    def from_games(cls, games, capacity=INITIAL_CAPACITY):
+        log = cls(capacity)
+        log.extend(games)
+        return log
+
+    def column(self, name):
+        # View of the filled part of a column (no copy)
+        return self.columns[name][:self.size]
+
+    def to_pandas(self, dates=False):
+        """
+        DataFrame over the stored columns without copying them.
+        With dates=True the int32 day numbers are converted to datetime64 (that column is copied).
+        """
+        frame = pd.DataFrame({name: self.column(name) for name in COLUMNS}, copy=False)
+        if dates:
+            frame["date"] = EPOCH + self.column("date").astype("timedelta64[D]")
+        return frame
+
+    def team_results(self, team_id):
+        """
+        One team's games as the season results table (Date, Win, Team Score, Opponent Score).
+        """
+        away = self.column("away_id") == team_id
+        home = self.column("home_id") == team_id
+        mask = away | home
+        is_home = home[mask]
+        scored = np.where(is_home, self.column("home_score")[mask], self.column("away_score")[mask])
+        allowed = np.where(is_home, self.column("away_score")[mask], self.column("home_score")[mask])
+        order = np.argsort(self.column("date")[mask], kind="stable")
+        dates = (EPOCH + self.column("date")[mask].astype("timedelta64[D]"))[order]
+        return pd.DataFrame({
+            "Date": pd.to_datetime(dates).strftime("%Y-%m-%d"),
+            "Win": np.where(scored > allowed, "W", "L")[order],
+            "Team Score": scored[order],
+            "Opponent Score": allowed[order],
+        })
+
+    def save(self, path):
+        np.savez_compressed(path, team_ids=np.array(list(self.team_names), dtype=np.int32),
+                            team_names=np.array(list(self.team_names.values()), dtype=str),
+                            **{name: self.column(name) for name in COLUMNS})
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            size = len(data["game_pk"])
+            log = cls(max(size, 1))
+            for name in COLUMNS:
+                log.columns[name][:size] = data[name]
+            log.size = size
+            log.team_names = dict(zip(data["team_ids"].tolist(), data["team_names"].tolist()))
+        return log
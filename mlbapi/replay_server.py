@@ -0,0 +1,87 @@
+# Offline stand-in for statsapi.mlb.com that replays recorded fixtures.
+#
+#   python -m mlbapi.replay_server --port 8765 --latency 0.05 --error-rate 0.02
+#   MLB_STATSAPI_BASE_URL=http://127.0.0.1:8765/api/v1 MLB_STATSAPI_CACHE=0 python "World Series/2Update_WS.py"
+#
+# Latency (with jitter) and error injection are seeded, so load tests of the
+# concurrency and caching code are repeatable.
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from mlbapi import fixtures
+
+# Status codes returned when an error is injected
+INJECTED_ERRORS = (429, 500, 503)
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server_version = "StatsApiReplay/1.0"
+
+    def do_GET(self):
+        config = self.server.config
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+
+        with self.server.random_lock:
+            delay = config.latency + self.server.random.uniform(0, config.jitter)
+            inject_error = self.server.random.random() < config.error_rate
+            error_status = self.server.random.choice(INJECTED_ERRORS)
+        time.sleep(delay)
+
+        if inject_error:
+            headers = {"Retry-After": "1"} if error_status in (429, 503) else {}
+            self.send_json(error_status, json.dumps({"message": "injected error"}), headers)
+            return
+
+        fixture = fixtures.load(url.path, params)
+        if fixture is None:
+            self.send_json(404, json.dumps({"message": f"no fixture for {url.path}?{url.query}"}))
+            return
+        self.send_json(fixture["status"], fixture["body"])
+
+    def send_json(self, status, body, headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.server.config.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8765, latency=0.0, jitter=0.0, error_rate=0.0, seed=0, verbose=False):
+    server = ThreadingHTTPServer((host, port), ReplayHandler)
+    server.config = argparse.Namespace(latency=latency, jitter=jitter, error_rate=error_rate, verbose=verbose)
+    server.random = random.Random(seed)
+    server.random_lock = threading.Lock()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded Stats API fixtures over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 429/500/503")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and error injection")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency, args.jitter, args.error_rate, args.seed, args.verbose)
+    print(f"Replaying fixtures from {fixtures.FIXTURES_DIR} on http://{args.host}:{args.port}/api/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
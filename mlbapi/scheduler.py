@@ -0,0 +1,88 @@
+# Rate limiting and retries for every request that actually goes over the network.
+#   - A token bucket caps the request rate across all threads (RATE per second, BURST at once).
+#   - 429 and 5xx responses and connection errors are retried with jittered exponential
+#     backoff, waiting for Retry-After instead when the server sends it.
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+RATE = float(os.environ.get("MLB_STATSAPI_RATE", 10)) # requests per second
+BURST = int(os.environ.get("MLB_STATSAPI_BURST", 20)) # requests allowed back to back
+MAX_RETRIES = int(os.environ.get("MLB_STATSAPI_MAX_RETRIES", 5))
+BACKOFF_BASE = 0.5 # seconds before the first retry (upper bound, jittered)
+BACKOFF_MAX = 30 # seconds
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    def __init__(self, rate=RATE, capacity=BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        # Block until a token is available, then take it
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+bucket = TokenBucket()
+
+
+def retry_after_seconds(response):
+    # Retry-After is either a number of seconds or an HTTP date
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, response=None):
+    delay = retry_after_seconds(response)
+    if delay is not None:
+        return min(delay, BACKOFF_MAX)
+    # "Full jitter": anywhere between 0 and the exponential cap
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def send(request, max_retries=MAX_RETRIES):
+    """
+    Call request() (which performs one HTTP request) under the rate limit, retrying
+    throttled, server-error and connection-error attempts. The last response is returned
+    even if it is still an error; the last exception is raised if every attempt failed.
+    """
+    for attempt in range(max_retries + 1):
+        bucket.acquire()
+        try:
+            response = request()
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+        if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+            return response
+        # Release the connection of the discarded attempt (streamed responses hold it open)
+        response.close()
+        time.sleep(backoff_delay(attempt, response))
+    return response
@@ -0,0 +1,302 @@
+# Typed records for the Stats API payloads the scripts read.
+# Each record is a slotted dataclass holding only the fields we use; everything else in
+# the payload is skipped while decoding. With msgspec installed, JSON is decoded straight
+# into these records in C; otherwise the stdlib json module is used and the dicts are
+# converted field by field, which gives the same records more slowly.
+
+import json
+import typing
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Optional
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+@dataclass(slots=True)
+class TeamRef:
+    id: int = 0
+    name: str = ""
+
+
+@dataclass(slots=True)
+class GameTeam:
+    team: TeamRef = field(default_factory=TeamRef)
+    score: Optional[int] = None
+    isWinner: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class GameTeams:
+    away: GameTeam = field(default_factory=GameTeam)
+    home: GameTeam = field(default_factory=GameTeam)
+
+
+@dataclass(slots=True)
+class Status:
+    detailedState: str = ""
+
+
+@dataclass(slots=True)
+class Venue:
+    id: Optional[int] = None
+    name: str = ""
+
+
+@dataclass(slots=True)
+class LinescoreTeam:
+    runs: Optional[int] = None
+    hits: Optional[int] = None
+    errors: Optional[int] = None
+    leftOnBase: Optional[int] = None
+
+
+@dataclass(slots=True)
+class LinescoreTeams:
+    away: LinescoreTeam = field(default_factory=LinescoreTeam)
+    home: LinescoreTeam = field(default_factory=LinescoreTeam)
+
+
+@dataclass(slots=True)
+class Linescore:
+    # Present on schedule games requested with hydrate=linescore
+    currentInning: Optional[int] = None
+    teams: LinescoreTeams = field(default_factory=LinescoreTeams)
+
+
+@dataclass(slots=True)
+class Game:
+    gamePk: int = 0
+    season: str = ""
+    gameType: str = ""
+    officialDate: str = ""
+    status: Status = field(default_factory=Status)
+    teams: GameTeams = field(default_factory=GameTeams)
+    venue: Venue = field(default_factory=Venue)
+    seriesGameNumber: Optional[int] = None
+    gamesInSeries: Optional[int] = None
+    linescore: Optional[Linescore] = None
+
+    def side(self, team_id):
+        # "home" or "away" for a team playing in this game, None otherwise
+        if self.teams.home.team.id == team_id:
+            return "home"
+        if self.teams.away.team.id == team_id:
+            return "away"
+        return None
+
+    def winner(self):
+        if self.teams.away.isWinner:
+            return self.teams.away
+        if self.teams.home.isWinner:
+            return self.teams.home
+        return None
+
+
+@dataclass(slots=True)
+class ScheduleDate:
+    date: str = ""
+    games: list[Game] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Schedule:
+    dates: list[ScheduleDate] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class NamedRef:
+    id: Optional[int] = None
+    name: str = ""
+
+
+@dataclass(slots=True)
+class Team:
+    id: int = 0
+    name: str = ""
+    abbreviation: str = ""
+    teamName: str = ""
+    shortName: str = ""
+    franchiseName: str = ""
+    clubName: str = ""
+    locationName: str = ""
+    firstYearOfPlay: str = ""
+    league: NamedRef = field(default_factory=NamedRef)
+    division: NamedRef = field(default_factory=NamedRef)
+    venue: NamedRef = field(default_factory=NamedRef)
+
+
+@dataclass(slots=True)
+class Teams:
+    teams: list[Team] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Season:
+    seasonId: str = ""
+    regularSeasonStartDate: str = ""
+    regularSeasonEndDate: str = ""
+    postSeasonStartDate: str = ""
+    postSeasonEndDate: str = ""
+
+
+@dataclass(slots=True)
+class Seasons:
+    seasons: list[Season] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SeriesTeam:
+    team: TeamRef = field(default_factory=TeamRef)
+
+
+@dataclass(slots=True)
+class SeriesTeams:
+    winner: SeriesTeam = field(default_factory=SeriesTeam)
+    loser: SeriesTeam = field(default_factory=SeriesTeam)
+
+
+@dataclass(slots=True)
+class Series:
+    seriesName: str = ""
+    isOver: bool = False
+    teams: SeriesTeams = field(default_factory=SeriesTeams)
+    games: list[Game] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PostseasonSeries:
+    series: list[Series] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Person:
+    id: int = 0
+    fullName: str = ""
+
+
+@dataclass(slots=True)
+class BattingStats:
+    atBats: int = 0
+    runs: int = 0
+    hits: int = 0
+    doubles: int = 0
+    triples: int = 0
+    homeRuns: int = 0
+    rbi: int = 0
+    baseOnBalls: int = 0
+    strikeOuts: int = 0
+    stolenBases: int = 0
+
+
+@dataclass(slots=True)
+class PitchingStats:
+    inningsPitched: str = "0.0"
+    outs: int = 0
+    hits: int = 0
+    runs: int = 0
+    earnedRuns: int = 0
+    baseOnBalls: int = 0
+    strikeOuts: int = 0
+    homeRuns: int = 0
+    numberOfPitches: int = 0
+
+
+@dataclass(slots=True)
+class PlayerStats:
+    batting: BattingStats = field(default_factory=BattingStats)
+    pitching: PitchingStats = field(default_factory=PitchingStats)
+
+
+@dataclass(slots=True)
+class BoxscorePlayer:
+    person: Person = field(default_factory=Person)
+    battingOrder: str = ""
+    stats: PlayerStats = field(default_factory=PlayerStats)
+
+
+@dataclass(slots=True)
+class BoxscoreTeam:
+    team: TeamRef = field(default_factory=TeamRef)
+    players: dict[str, BoxscorePlayer] = field(default_factory=dict) # keyed "ID<playerId>"
+    batters: list[int] = field(default_factory=list)
+    pitchers: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BoxscoreTeams:
+    away: BoxscoreTeam = field(default_factory=BoxscoreTeam)
+    home: BoxscoreTeam = field(default_factory=BoxscoreTeam)
+
+
+@dataclass(slots=True)
+class Boxscore:
+    teams: BoxscoreTeams = field(default_factory=BoxscoreTeams)
+
+
+_converters = {}
+
+
+def _converter(kind):
+    """
+    Pure-Python fallback for msgspec.convert: build (once per type) a function that turns
+    decoded JSON into `kind`. Dicts become dataclasses and unknown keys are ignored.
+    """
+    if kind in _converters:
+        return _converters[kind]
+
+    origin = typing.get_origin(kind)
+    if origin is typing.Union:
+        inner = _converter(next(arg for arg in typing.get_args(kind) if arg is not type(None)))
+        convert_value = lambda value: None if value is None else inner(value)
+    elif origin is list:
+        item = _converter(typing.get_args(kind)[0])
+        convert_value = lambda value: [item(v) for v in value]
+    elif origin is dict:
+        item = _converter(typing.get_args(kind)[1])
+        convert_value = lambda value: {k: item(v) for k, v in value.items()}
+    elif is_dataclass(kind):
+        hints = typing.get_type_hints(kind)
+        field_converters = []
+        for f in fields(kind):
+            convert_field = _converter(hints[f.name])
+            # Plain int/bool fields need no conversion at all
+            field_converters.append((f.name, None if convert_field is _identity else convert_field))
+
+        def convert_value(value):
+            kwargs = {}
+            for name, convert_field in field_converters:
+                if name in value:
+                    kwargs[name] = value[name] if convert_field is None else convert_field(value[name])
+            return kind(**kwargs)
+    elif kind is str:
+        convert_value = lambda value: value if isinstance(value, str) else str(value)
+    else:
+        convert_value = _identity
+
+    _converters[kind] = convert_value
+    return convert_value
+
+
+def _identity(value):
+    return value
+
+
+def convert(data, kind):
+    """
+    Convert already-decoded JSON (dicts and lists) into a record of type `kind`.
+    """
+    if msgspec is not None:
+        return msgspec.convert(data, kind, strict=False)
+    return _converter(kind)(data)
+
+
+def decode(body, kind):
+    """
+    Decode a JSON body (bytes or str) directly into a record of type `kind`.
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(body, type=kind, strict=False)
+    return _converter(kind)(json.loads(body))
@@ -0,0 +1,129 @@
+# Typed table storage for the project's outputs.
+# Tables are written as compressed Parquet next to their CSV (same name, .parquet),
+# and the CSV is kept as an export. Readers prefer the Parquet copy when it is at
+# least as new as the CSV, so types are not re-inferred and columns can be selected.
+# Without pyarrow installed everything falls back to plain CSV.
+
+import os
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow # noqa: F401
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+COMPRESSION = "zstd"
+
+# Column types per table; columns missing from a frame are ignored
+SCHEMAS = {
+    "world_series": {
+        "Year": "int16",
+        "Team": "string",
+        "Score": "string",
+        "Games": "int8",
+    },
+    "franchise_stats": {
+        "franchise_id": "int32",
+        "Team": "string",
+        "First Year": "Int16",
+        "Wins": "int16",
+        "Losses": "int16",
+        "Appearances": "int16",
+        "Last Championship": "Int16",
+        "Seasons": "string",
+        "Through": "int16",
+        "Win %": "float64",
+        "Years Since Last Championship": "Int16",
+        "Championships per Year Active": "float64",
+    },
+    "season_results": {
+        "Team": "string",
+        "Date": "datetime64[ns]",
+        "Win": "category",
+        "Team Score": "int16",
+        "Opponent Score": "int16",
+    },
+    "teams_info": {
+        "id": "int32",
+        "name": "string",
+        "abbreviation": "string",
+        "teamName": "string",
+        "shortName": "string",
+        "franchiseName": "string",
+        "clubName": "string",
+        "location": "string",
+        "league": "category",
+        "division": "category",
+        "venue": "string",
+        "firstYearOfPlay": "Int16",
+        "yearsActive": "Int16",
+    },
+    "map": {
+        "Team": "string",
+        "League": "string",
+        "Division": "string",
+        "Latitude": "float64",
+        "Longitude": "float64",
+        "City": "string",
+        "State": "string",
+        "Stadium": "string",
+        "LogoURL": "string",
+    },
+}
+
+
+def parquet_path(path):
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def apply_schema(df, table):
+    schema = SCHEMAS.get(table, {})
+    types = {column: dtype for column, dtype in schema.items() if column in df.columns}
+    for column, dtype in types.items():
+        if dtype.startswith("Int") or dtype.startswith("int"):
+            # Placeholders such as "N/A" become missing values instead of failing the cast
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+    return df.astype(types)
+
+
+def _atomic_write(path, write):
+    # Write to a temporary file in the same folder, then swap it in
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def write_table(df, path, table=None, csv=True):
+    """
+    Save a table to Parquet (when available) and, unless csv=False, to the CSV at `path`.
+    Both files are replaced atomically.
+    """
+    if table:
+        df = apply_schema(df.copy(), table)
+    if csv or not HAS_PARQUET:
+        _atomic_write(path, lambda tmp: df.to_csv(tmp, index=False))
+    if HAS_PARQUET:
+        _atomic_write(parquet_path(path), lambda tmp: df.to_parquet(tmp, index=False, compression=COMPRESSION))
+
+
+def read_table(path, columns=None, table=None):
+    """
+    Load a table saved with write_table. `path` is the CSV path; the Parquet copy is used
+    when it exists and is not older than the CSV. Only `columns` are read when given.
+    """
+    pq_path = parquet_path(path)
+    use_parquet = HAS_PARQUET and os.path.exists(pq_path) and (
+        not os.path.exists(path) or os.path.getmtime(pq_path) >= os.path.getmtime(path)
+    )
+    if use_parquet:
+        return pd.read_parquet(pq_path, columns=columns)
+    df = pd.read_csv(path, usecols=columns)
+    return apply_schema(df, table) if table else df
@@ -0,0 +1,261 @@
+# Local SQLite store for teams, venues, games and postseason series.
+# Fetch scripts bulk-insert what they download (executemany, one transaction per batch)
+# and lookups such as "all games of team X between two dates" use indexes instead of
+# scanning CSV files. The database runs in WAL mode so readers never block a writer.
+
+import os
+import sqlite3
+
+from mlbapi import cache
+
+DB_PATH = os.environ.get("MLB_DB_PATH", os.path.join(cache.ROOT_DIR, "mlb.sqlite"))
+BATCH_SIZE = 1000 # rows per executemany transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS venues (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    latitude REAL,
+    longitude REAL
+);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    abbreviation TEXT,
+    team_name TEXT,
+    short_name TEXT,
+    franchise_name TEXT,
+    club_name TEXT,
+    location TEXT,
+    league TEXT,
+    division TEXT,
+    venue_id INTEGER REFERENCES venues (id),
+    first_year_of_play INTEGER
+);
+CREATE TABLE IF NOT EXISTS games (
+    game_pk INTEGER PRIMARY KEY,
+    season INTEGER NOT NULL,
+    game_type TEXT NOT NULL,
+    official_date TEXT NOT NULL,
+    status TEXT,
+    away_id INTEGER NOT NULL,
+    away_name TEXT,
+    away_score INTEGER,
+    home_id INTEGER NOT NULL,
+    home_name TEXT,
+    home_score INTEGER,
+    winner_id INTEGER,
+    venue_id INTEGER,
+    series_game_number INTEGER,
+    games_in_series INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_games_home_date ON games (home_id, official_date);
+CREATE INDEX IF NOT EXISTS idx_games_away_date ON games (away_id, official_date);
+CREATE INDEX IF NOT EXISTS idx_games_season_type ON games (season, game_type);
+CREATE TABLE IF NOT EXISTS linescores (
+    game_pk INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    side TEXT NOT NULL,
+    runs INTEGER,
+    hits INTEGER,
+    errors INTEGER,
+    left_on_base INTEGER,
+    PRIMARY KEY (game_pk, side)
+);
+CREATE TABLE IF NOT EXISTS batting_lines (
+    game_pk INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    player_name TEXT,
+    batting_order INTEGER,
+    at_bats INTEGER,
+    runs INTEGER,
+    hits INTEGER,
+    doubles INTEGER,
+    triples INTEGER,
+    home_runs INTEGER,
+    rbi INTEGER,
+    walks INTEGER,
+    strikeouts INTEGER,
+    stolen_bases INTEGER,
+    PRIMARY KEY (game_pk, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_batting_player ON batting_lines (player_id);
+CREATE TABLE IF NOT EXISTS pitching_lines (
+    game_pk INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    player_name TEXT,
+    innings_pitched TEXT,
+    outs INTEGER,
+    hits INTEGER,
+    runs INTEGER,
+    earned_runs INTEGER,
+    walks INTEGER,
+    strikeouts INTEGER,
+    home_runs INTEGER,
+    pitches INTEGER,
+    PRIMARY KEY (game_pk, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_pitching_player ON pitching_lines (player_id);
+CREATE TABLE IF NOT EXISTS postseason_series (
+    season INTEGER NOT NULL,
+    series_name TEXT NOT NULL,
+    winner TEXT,
+    loser TEXT,
+    final_score TEXT,
+    games INTEGER,
+    PRIMARY KEY (season, series_name)
+);
+CREATE INDEX IF NOT EXISTS idx_series_winner ON postseason_series (winner);
+CREATE INDEX IF NOT EXISTS idx_series_loser ON postseason_series (loser);
+"""
+
+
+def connect(path=DB_PATH):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def game_row(game):
+    # One games-table row from a schemas.Game record
+    away = game.teams.away
+    home = game.teams.home
+    winner = game.winner()
+    return (
+        game.gamePk,
+        int(game.season or game.officialDate[:4]),
+        game.gameType,
+        game.officialDate,
+        game.status.detailedState,
+        away.team.id,
+        away.team.name,
+        away.score,
+        home.team.id,
+        home.team.name,
+        home.score,
+        winner.team.id if winner else None,
+        game.venue.id,
+        game.seriesGameNumber,
+        game.gamesInSeries,
+    )
+
+
+def insert_games(conn, dates):
+    """
+    Bulk-insert (or refresh) every game in a list of schemas.ScheduleDate records, plus their venues.
+    """
+    return insert_game_records(conn, (game for day in dates for game in day.games))
+
+
+def insert_game_records(conn, games, batch_size=BATCH_SIZE):
+    """
+    Bulk-insert schemas.Game records from any iterable (e.g. a streamed schedule), batch_size rows at a time.
+    """
+    count = 0
+    batch = []
+    for game in games:
+        batch.append(game)
+        if len(batch) >= batch_size:
+            count += _insert_game_batch(conn, batch)
+            batch = []
+    if batch:
+        count += _insert_game_batch(conn, batch)
+    return count
+
+
+def _insert_game_batch(conn, games):
+    venues = {game.venue.id: game.venue.name for game in games if game.venue.id}
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO venues (id, name) VALUES (?, ?)", venues.items())
+        insert_game_rows(conn, map(game_row, games))
+    return len(games)
+
+
+def insert_game_rows(conn, rows):
+    """
+    Insert (or refresh) rows built with game_row. Runs in the caller's transaction.
+    """
+    conn.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def insert_rows(conn, table, rows):
+    """
+    Bulk-insert (or replace) plain tuples into one of the tables above.
+    """
+    rows = list(rows)
+    if rows:
+        marks = ", ".join("?" * len(rows[0]))
+        with conn:
+            conn.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({marks})", rows)
+    return len(rows)
+
+
+def insert_teams(conn, teams):
+    """
+    Bulk-insert teams (as returned by /teams) and their venues.
+    """
+    venue_rows = [(team["venue"]["id"], team["venue"].get("name")) for team in teams if team.get("venue", {}).get("id")]
+    team_rows = [
+        (
+            team["id"],
+            team["name"],
+            team.get("abbreviation"),
+            team.get("teamName"),
+            team.get("shortName"),
+            team.get("franchiseName"),
+            team.get("clubName"),
+            team.get("locationName"),
+            team.get("league", {}).get("name"),
+            team.get("division", {}).get("name"),
+            team.get("venue", {}).get("id"),
+            int(team["firstYearOfPlay"]) if str(team.get("firstYearOfPlay", "")).isdigit() else None,
+        )
+        for team in teams
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT INTO venues (id, name) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET name = excluded.name",
+            venue_rows,
+        )
+        conn.executemany("INSERT OR REPLACE INTO teams VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", team_rows)
+    return len(team_rows)
+
+
+def insert_series(conn, rows):
+    """
+    Bulk-insert postseason series as (season, series_name, winner, loser, final_score, games) tuples.
+    """
+    rows = list(rows)
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO postseason_series VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+def games_for_team(conn, team_id, start_date, end_date, game_type=None):
+    # Two index range scans (home and away) instead of a full table scan
+    type_filter = "AND game_type = ?" if game_type else ""
+    args = (team_id, start_date, end_date) + ((game_type,) if game_type else ())
+    return conn.execute(f"""
+        SELECT * FROM games WHERE home_id = ? AND official_date BETWEEN ? AND ? {type_filter}
+        UNION ALL
+        SELECT * FROM games WHERE away_id = ? AND official_date BETWEEN ? AND ? {type_filter}
+        ORDER BY official_date
+    """, args + args).fetchall()
+
+
+def series_appearances(conn, team_names, series_name="World Series"):
+    """
+    Every appearance of any of team_names (e.g. all names a franchise has used) in a series,
+    as (season, winner, loser, final_score, games) rows.
+    """
+    names = list(team_names)
+    marks = ", ".join("?" * len(names))
+    return conn.execute(f"""
+        SELECT season, winner, loser, final_score, games FROM postseason_series
+        WHERE series_name = ? AND (winner IN ({marks}) OR loser IN ({marks}))
+        ORDER BY season
+    """, [series_name] + names + names).fetchall()
@@ -0,0 +1,59 @@
+# Streaming reader for large /schedule responses.
+# A league-wide, full-season schedule with hydrations is tens of MB; instead of
+# decoding the whole payload, dates[].games[] is parsed incrementally with ijson and
+# each game is converted to a compact schemas.Game record (unused fields dropped)
+# before it is yielded, so peak memory does not grow with the requested date range.
+# Without ijson installed the response is decoded in one piece.
+# Streamed responses bypass the response cache and the raw archive (both need the whole
+# body); with MLB_STATSAPI_RECORD=1 the body is kept while it is read and saved as a fixture.
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from mlbapi import client, fixtures, scheduler, schemas
+
+GAMES_PREFIX = "dates.item.games.item"
+
+
+class _Recorder:
+    # File-like wrapper that keeps a copy of everything read through it
+    def __init__(self, raw):
+        self.raw = raw
+        self.chunks = []
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.chunks.append(data)
+        return data
+
+    def body(self):
+        return b"".join(self.chunks)
+
+
+def iter_games(path="schedule", params=None, timeout=client.TIMEOUT):
+    """
+    Yield schemas.Game records from a schedule endpoint one at a time.
+    Raises requests.HTTPError if the request ultimately fails.
+    """
+    url = client.build_url(path)
+    session = client.get_session()
+    response = scheduler.send(lambda: session.get(url, params=params, timeout=timeout, stream=True))
+    with response:
+        response.raise_for_status()
+        if ijson is None:
+            if fixtures.RECORD:
+                fixtures.save(path, params, response.status_code, response.content)
+            for day in schemas.decode(response.content, schemas.Schedule).dates:
+                yield from day.games
+            return
+        response.raw.decode_content = True # let urllib3 undo gzip while we read
+        source = _Recorder(response.raw) if fixtures.RECORD else response.raw
+        for game in ijson.items(source, GAMES_PREFIX, use_float=True):
+            yield schemas.convert(game, schemas.Game)
+        if fixtures.RECORD:
+            # ijson stops at the last game; read the rest so the fixture is the complete body
+            while source.read(65536):
+                pass
+            fixtures.save(path, params, response.status_code, source.body())
@@ -0,0 +1,102 @@
+# Name / abbreviation / alias -> team ID index.
+# Seeded from Teams Info/MLB_Teams_Info.csv, refreshed from /teams only when the
+# stored index is older than MAX_AGE, and kept in memory so every lookup after
+# the first one is a single dictionary access.
+
+import csv
+import json
+import os
+import time
+
+from mlbapi import cache, client, schemas
+
+TEAMS_INFO_PATH = os.path.join(cache.ROOT_DIR, "Teams Info", "MLB_Teams_Info.csv")
+INDEX_PATH = os.path.join(cache.CACHE_DIR, "team_index.json")
+MAX_AGE = 7 * 24 * 60 * 60 # seconds before the stored index is refreshed from the API
+
+# Fields that can be used to look a team up, as named in /teams and MLB_Teams_Info.csv
+ALIAS_FIELDS = ("name", "abbreviation", "teamName", "shortName", "clubName")
+
+_index = None
+_refreshed = False
+
+
+def normalize(name):
+    return " ".join(str(name).lower().split())
+
+
+def build_index(teams):
+    """
+    Map every alias of every team to its ID. Aliases shared by two teams
+    (e.g. "Los Angeles") are dropped so they never resolve to the wrong club.
+    """
+    index = {}
+    ambiguous = set()
+    for team in teams:
+        aliases = {normalize(team[field]) for field in ALIAS_FIELDS if team.get(field)}
+        if team.get("location") and team.get("teamName"):
+            aliases.add(normalize(f"{team['location']} {team['teamName']}"))
+        for alias in aliases:
+            if alias in index and index[alias] != int(team["id"]):
+                ambiguous.add(alias)
+            index[alias] = int(team["id"])
+    for alias in ambiguous:
+        del index[alias]
+    return index
+
+
+def read_teams_csv(path=TEAMS_INFO_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+def fetch_teams():
+    # Only MLB clubs (sportId=1), not every level of every sport
+    data = client.get_json("teams", params={"sportId": 1})
+    if data is None:
+        return []
+    return [
+        dict({field: getattr(team, field) for field in ALIAS_FIELDS}, id=team.id, location=team.locationName)
+        for team in schemas.convert(data, schemas.Teams).teams
+    ]
+
+
+def save_index(index, path=INDEX_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(index, file)
+
+
+def load_index(refresh=False):
+    """
+    Return the alias -> ID index, loading it from disk or rebuilding it if it is missing or stale.
+    """
+    global _index, _refreshed
+    if _index is not None and not refresh:
+        return _index
+
+    if not refresh and os.path.exists(INDEX_PATH) and time.time() - os.path.getmtime(INDEX_PATH) < MAX_AGE:
+        with open(INDEX_PATH, encoding="utf-8") as file:
+            _index = json.load(file)
+        return _index
+
+    teams = read_teams_csv()
+    fetched = fetch_teams()
+    _refreshed = True
+    _index = build_index(teams + fetched)
+    if fetched:
+        save_index(_index)
+    return _index
+
+
+def get_team_id(team_name):
+    """
+    Resolve a team name, abbreviation or alias to its Stats API ID, or None if unknown.
+    """
+    team_id = load_index().get(normalize(team_name))
+    if team_id is None and not _refreshed:
+        # Unknown name: maybe a new or renamed club, so rebuild from the API once per process
+        team_id = load_index(refresh=True).get(normalize(team_name))
+    return team_id